@@ -22,6 +22,8 @@ from a2a.server.request_handlers import DefaultRequestHandler
 
 from agents.activity.agent_executor import ActivityAgentExecutor
 from agents.activity.card import AGENT_CARD
+from agents.travel.serpapi_tools import aclose_serpapi_client
+from common import event_loop
 from config.config import (
     DEFAULT_MESSAGE_TRANSPORT,
     TRANSPORT_SERVER_ENDPOINT,
@@ -94,12 +96,18 @@ async def main(enable_http: bool):
         TRANSPORT_SERVER_ENDPOINT
     )))
     
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Release pooled SerpAPI connections on shutdown. This lives here
+        # rather than in a Starlette lifespan because the transport path
+        # serves requests even when the HTTP server is disabled.
+        await aclose_serpapi_client()
 
 
 if __name__ == '__main__':
     try:
-        asyncio.run(main(ENABLE_HTTP))
+        event_loop.run(main(ENABLE_HTTP))
     except KeyboardInterrupt:
         print("\nShutting down gracefully on keyboard interrupt.")
     except Exception as e:
@@ -2,4 +2,9 @@
 class AuthError(Exception):
   """Custom exception for Agntcy Identity authentication or authorization errors."""
   def __init__(self, message: str):
-    super().__init__(message)
\ No newline at end of file
+    super().__init__(message)
+
+class SerpAPIError(Exception):
+  """Custom exception for failed SerpAPI searches or errors reported by SerpAPI."""
+  def __init__(self, message: str):
+    super().__init__(message)
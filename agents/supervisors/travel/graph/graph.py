@@ -16,6 +16,8 @@ Node Flow:
                    └── reflection_node ←┘
 """
 
+import asyncio
+import heapq
 import logging
 import uuid
 from datetime import datetime, timedelta
@@ -423,25 +425,41 @@ Respond with ONLY 'travel_search' or 'general':""",
         trip_type = "one-way" if params.is_one_way else "round-trip"
         logger.info(f"Searching full trip ({trip_type}): {params.origin} -> {params.destination}")
         
-        try:
-            # Search for flights
-            flights = await get_flights_via_a2a(
+        # Search flights, hotels, and activities concurrently - the three
+        # agents are independent, so the wait is the slowest search. An empty
+        # flight result cancels the siblings instead of paying for them.
+        hotel_location = params.destination_city or params.destination
+        flights_task = asyncio.create_task(
+            get_flights_via_a2a(
                 params.origin,
                 params.destination,
                 params.start_date,
                 params.end_date if not params.is_one_way else None,
                 is_one_way=params.is_one_way,
             )
-            
-            if not flights:
-                return {"messages": [AIMessage(content=f"I couldn't find any flights from {params.origin} to {params.destination}. Please try again.")]}
-
-            # Search for hotels
-            hotel_location = params.destination_city or params.destination
-            hotels = await get_hotels_via_a2a(hotel_location, params.start_date, hotel_checkout_date)
-            
-            if not hotels:
-                return {"messages": [AIMessage(content=f"I found flights but couldn't find hotels in {hotel_location}.")]}
+        )
+        hotels_task = asyncio.create_task(
+            get_hotels_via_a2a(hotel_location, params.start_date, hotel_checkout_date)
+        )
+        activities_task = asyncio.create_task(
+            get_activities_via_a2a(hotel_location, "things to do")
+        )
+        
+        try:
+            pending = {flights_task, hotels_task, activities_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                if flights_task in done:
+                    flights = flights_task.result()
+                    if not flights:
+                        return {"messages": [AIMessage(content=f"I couldn't find any flights from {params.origin} to {params.destination}. Please try again.")]}
+                
+                # Hotels are only reported once the flights are known
+                if flights_task.done() and hotels_task.done():
+                    hotels = hotels_task.result()
+                    if not hotels:
+                        return {"messages": [AIMessage(content=f"I found flights but couldn't find hotels in {hotel_location}.")]}
 
             # Find cheapest valid plan
             plan = find_cheapest_plan(flights, hotels)
@@ -453,12 +471,12 @@ Respond with ONLY 'travel_search' or 'general':""",
                     f"Try an earlier departure or later check-in time."
                 )]}
 
-            # Search for activities (optional)
-            activities = []
-            try:
-                activities = await get_activities_via_a2a(hotel_location, "things to do")
-            except Exception as e:
-                logger.warning(f"Activity search failed: {e}")
+            # Activities are optional
+            if activities_task.exception() is not None:
+                logger.warning(f"Activity search failed: {activities_task.exception()}")
+                activities = []
+            else:
+                activities = activities_task.result()
 
             # Format and return
             response = self._format_travel_plan(plan, params, activities, hotel_checkout_date)
@@ -467,6 +485,11 @@ Respond with ONLY 'travel_search' or 'general':""",
         except Exception as e:
             logger.error(f"Error during full trip search: {e}")
             return {"messages": [AIMessage(content=f"I encountered an error: {str(e)}")]}
+        finally:
+            # Cancel whichever search is still in flight after an early return
+            for task in (flights_task, hotels_task, activities_task):
+                if not task.done():
+                    task.cancel()
 
     async def _extract_travel_params(self, user_message: str) -> TravelSearchArgs:
         """
@@ -922,8 +945,10 @@ Would you like more details about any of these, or should I search for flights a
         
         nights_text = f"{nights} night{'s' if nights != 1 else ''}"
         
-        # Sort hotels by overall rating (descending), then by price (ascending)
-        sorted_hotels = sorted(
+        # Top 10 hotels by overall rating (descending), then by price (ascending)
+        # nsmallest selects them without sorting the full result list
+        top_hotels = heapq.nsmallest(
+            10,
             hotels,
             key=lambda h: (
                 -(h.get('overall_rating', 0) or h.get('rating', 0) or 0),  # Higher rating first
@@ -937,7 +962,7 @@ Dates: {params.start_date} to {params.end_date} ({nights_text})
 Sorted by rating (best first):
 
 """
-        for i, hotel in enumerate(sorted_hotels[:10], 1):
+        for i, hotel in enumerate(top_hotels, 1):
             name = hotel.get('name', 'Unknown Hotel')
             price_per_night = hotel.get('price', 0) or 0
             total_price = price_per_night * nights
@@ -1015,16 +1040,9 @@ Would you like me to also find flights to {location}?"""
             
             # Only show layover for one-way flights (round-trip return doesn't have consistent layover data)
             if is_one_way and stops > 0:
-                flight_legs = flight.get('flights', [])
-                if len(flight_legs) > 1:
-                    layover_airports = []
-                    for j in range(len(flight_legs) - 1):
-                        leg = flight_legs[j]
-                        layover_airport = leg.get('arrival_airport', {}).get('id', '') or leg.get('arrival_code', '')
-                        if layover_airport:
-                            layover_airports.append(layover_airport)
-                    if layover_airports:
-                        response += f"- **Layover**: {', '.join(layover_airports)}\n"
+                layover_airports = [code for code in flight.get('layover_codes', []) if code]
+                if layover_airports:
+                    response += f"- **Layover**: {', '.join(layover_airports)}\n"
             
             # Return Flight card (for round-trip only) - no layover info for consistency
             if not is_one_way and flight.get('return_flight'):
@@ -1296,6 +1314,19 @@ How can I help you plan your next adventure?"""
             "messages": [AIMessage(content=response)],
         }
 
+    async def warmup(self) -> None:
+        """
+        Pre-create the LLM clients used by the graph nodes.
+        
+        The nodes create their LLM clients lazily; calling this at startup
+        moves that setup cost off the first user request.
+        """
+        if not self.supervisor_llm:
+            self.supervisor_llm = get_llm()
+        if not self.travel_search_llm:
+            self.travel_search_llm = get_llm(streaming=False)
+        logger.info("Travel graph warmed up")
+
     async def serve(self, prompt: str) -> str:
         """
         Process a travel request and return the complete response.
@@ -9,6 +9,7 @@ These tools use the A2A protocol to send requests and receive responses
 via NATS transport.
 """
 
+import asyncio
 import logging
 import json
 from uuid import uuid4
@@ -431,32 +432,30 @@ async def find_best_travel_plan(
     hotel_location = destination_city or destination
     logger.info(f"Tool: Finding best plan via A2A: {origin} -> {destination}, hotels in {hotel_location}, {start_date} to {end_date}")
     
+    # Launch both searches concurrently so an empty result on either side
+    # can cancel the sibling instead of paying for a second round trip
+    flights_task = asyncio.create_task(
+        get_flights_via_a2a(origin, destination, start_date, end_date)
+    )
+    # Use city name for hotel search (Google Hotels needs city names, not airport codes)
+    hotels_task = asyncio.create_task(
+        get_hotels_via_a2a(hotel_location, start_date, end_date)
+    )
+    
     try:
-        # Search for flights via A2A using internal functions
-        # (not the @tool decorated versions to avoid 'not callable' error)
-        flight_result = await _search_flights_internal(origin, destination, start_date, end_date)
-        # Use city name for hotel search (Google Hotels needs city names, not airport codes)
-        hotel_result = await _search_hotels_internal(hotel_location, start_date, end_date)
-        
-        # Parse flight results
-        try:
-            flight_data = json.loads(flight_result)
-            flights = flight_data.get("flights", []) if flight_data.get("status") == "success" else []
-        except json.JSONDecodeError:
-            flights = []
-        
-        # Parse hotel results
-        try:
-            hotel_data = json.loads(hotel_result)
-            hotels = hotel_data.get("hotels", []) if hotel_data.get("status") == "success" else []
-        except json.JSONDecodeError:
-            hotels = []
-        
-        if not flights:
-            return f"No flights found from {origin} to {destination}. The Flight Agent may be unavailable."
-        
-        if not hotels:
-            return f"No hotels found in {hotel_location}. The Hotel Agent may be unavailable."
+        pending = {flights_task, hotels_task}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            if flights_task in done:
+                flights = flights_task.result()
+                if not flights:
+                    return f"No flights found from {origin} to {destination}. The Flight Agent may be unavailable."
+            
+            if hotels_task in done:
+                hotels = hotels_task.result()
+                if not hotels:
+                    return f"No hotels found in {hotel_location}. The Hotel Agent may be unavailable."
         
         # Find cheapest valid combination
         plan = find_cheapest_plan(flights, hotels)
@@ -501,3 +500,8 @@ async def find_best_travel_plan(
     except Exception as e:
         logger.error(f"Error finding best travel plan: {e}")
         return f"Error finding travel plan: {str(e)}"
+    finally:
+        # Cancel whichever search is still in flight after an early return
+        for task in (flights_task, hotels_task):
+            if not task.done():
+                task.cancel()
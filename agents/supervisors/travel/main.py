@@ -16,11 +16,13 @@ by searching SerpAPI and applying timing constraints.
 
 import logging
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
@@ -44,11 +46,26 @@ load_dotenv()
 # This enables observability for all agent operations
 shared.set_factory(AgntcyFactory("lungo.travel_supervisor", enable_tracing=True))
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build and warm up the travel graph (LangGraph workflow) once per worker.
+    
+    Doing this at startup rather than import time keeps module import cheap
+    and lets the first request skip LLM client setup.
+    """
+    app.state.graph = TravelGraph()
+    await app.state.graph.warmup()
+    yield
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Travel Planning Agent",
     description="AI agent that finds the cheapest flight + hotel combinations for trips",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for frontend access
@@ -60,8 +77,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize the travel graph (LangGraph workflow)
-travel_graph = TravelGraph()
+# Compress JSON responses (agent card, about, suggested prompts) for polling clients
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 
 class PromptRequest(BaseModel):
@@ -108,7 +125,7 @@ async def get_capabilities():
 
 
 @app.post("/agent/prompt")
-async def handle_prompt(request: PromptRequest):
+async def handle_prompt(request: PromptRequest, http_request: Request):
     """
     Process a travel planning request (non-streaming).
     
@@ -131,7 +148,7 @@ async def handle_prompt(request: PromptRequest):
     try:
         with session_start() as session_id:
             # Execute the travel graph and wait for completion
-            result = await travel_graph.serve(request.prompt)
+            result = await http_request.app.state.graph.serve(request.prompt)
             logger.info(f"Travel search completed, session: {session_id['executionID']}")
             return {"response": result, "session_id": session_id["executionID"]}
     except ValueError as ve:
@@ -143,7 +160,7 @@ async def handle_prompt(request: PromptRequest):
 
 
 @app.post("/agent/prompt/stream")
-async def handle_stream_prompt(request: PromptRequest):
+async def handle_stream_prompt(request: PromptRequest, http_request: Request):
     """
     Process a travel planning request with streaming response.
     
@@ -164,6 +181,8 @@ async def handle_stream_prompt(request: PromptRequest):
         {"response": "Found 15 flights...", "session_id": "..."}
         {"response": "Best deal: $1,234 total...", "session_id": "..."}
     """
+    travel_graph = http_request.app.state.graph
+    
     try:
         with session_start() as session_id:
             
@@ -185,6 +204,8 @@ async def handle_stream_prompt(request: PromptRequest):
                 headers={
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
+                    # Opt out of GZipMiddleware so chunks are flushed immediately
+                    "Content-Encoding": "identity",
                 }
             )
     except ValueError as ve:
@@ -10,8 +10,15 @@ using SerpAPI, and finding the cheapest travel plan with timing constraints.
 Key components:
 - serpapi_tools: Functions to search flights and hotels via SerpAPI
 - travel_logic: Business logic for filtering hotels and finding optimal plans
+- models: Search result shapes
 """
 
+from agents.travel.models import (
+    ActivityResult,
+    FlightResult,
+    HotelResult,
+    ReturnFlightResult,
+)
 from agents.travel.serpapi_tools import search_flights, search_hotels
 from agents.travel.travel_logic import (
     extract_arrival_datetime,
@@ -20,6 +27,10 @@ from agents.travel.travel_logic import (
 )
 
 __all__ = [
+    "ActivityResult",
+    "FlightResult",
+    "HotelResult",
+    "ReturnFlightResult",
     "search_flights",
     "search_hotels",
     "extract_arrival_datetime",
@@ -0,0 +1,236 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Search Result Cache
+
+In-process TTL cache for SerpAPI search results.
+
+Flight, hotel, and activity searches for the same query are effectively
+deterministic over short windows, so repeated searches during a planning
+session are served from memory instead of another SerpAPI round trip
+(seconds of latency and a paid API call). Only successful results are
+stored; failures are never cached.
+
+An optional Redis store can back the in-process cache so that restarted
+workers and other replicas reuse each other's results.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import orjson
+
+logger = logging.getLogger("lungo.travel.cache")
+
+
+class RedisCacheStore:
+    """
+    Shared second-level store for QueryCache, backed by Redis.
+
+    Values are stored as orjson-encoded [expires_at, value] pairs under a
+    key derived from the query key, with a matching Redis expiry. Redis
+    errors are logged and treated as misses so a cache outage never fails
+    a search: connects and commands use short socket timeouts, and after a
+    failure the store is skipped for a cool-down period instead of making
+    every search wait on a dead server.
+
+    The redis package is imported when the store is created, so deployments
+    that do not configure a Redis URL never need it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "lungo:serpapi:",
+        socket_timeout: float = 0.25,
+        retry_after: float = 30.0,
+    ):
+        """
+        Args:
+            url: Redis connection URL (e.g. "redis://localhost:6379/0")
+            prefix: Prefix for all keys written by this store
+            socket_timeout: Seconds to wait on a Redis connect or command
+            retry_after: Seconds to skip the store after a Redis error
+
+        Raises:
+            ImportError: If the optional redis package is not installed
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError(
+                "SERPAPI_CACHE_REDIS_URL is set but the redis package is not "
+                "installed; install the 'redis' extra"
+            ) from e
+
+        self._redis = redis
+        self.url = url
+        self.prefix = prefix
+        self.socket_timeout = socket_timeout
+        self.retry_after = retry_after
+        self._client = None
+        self._skip_until = 0.0
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = self._redis.Redis.from_url(
+                self.url,
+                socket_connect_timeout=self.socket_timeout,
+                socket_timeout=self.socket_timeout,
+            )
+        return self._client
+
+    def _redis_key(self, key: Hashable) -> str:
+        return self.prefix + orjson.dumps(key).decode()
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._skip_until
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        self._skip_until = time.monotonic() + self.retry_after
+        logger.warning(
+            "Redis cache %s failed, skipping the shared cache for %.0fs: %s",
+            operation, self.retry_after, error,
+        )
+
+    async def get(self, key: Hashable) -> Optional[tuple[float, list]]:
+        """
+        Look up a shared entry.
+
+        Args:
+            key: Normalized query key (a tuple of JSON-serializable values)
+
+        Returns:
+            Tuple of (wall-clock expiry timestamp, result list), or None on a
+            miss, a Redis error, or while the store is being skipped
+        """
+        if not self._available():
+            return None
+        try:
+            payload = await self._get_client().get(self._redis_key(key))
+            if payload is None:
+                return None
+            expires_at, value = orjson.loads(payload)
+            return expires_at, value
+        except Exception as e:
+            self._failed("read", e)
+            return None
+
+    async def set(self, key: Hashable, value: list, ttl: float) -> None:
+        """
+        Store a shared entry (skipped while the store is unavailable).
+
+        Args:
+            key: Normalized query key (a tuple of JSON-serializable values)
+            value: Result list to cache
+            ttl: Seconds the entry stays fresh
+        """
+        if not self._available():
+            return
+        try:
+            payload = orjson.dumps([time.time() + ttl, value])
+            await self._get_client().set(self._redis_key(key), payload, px=int(ttl * 1000))
+        except Exception as e:
+            self._failed("write", e)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool, if one was opened."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+
+class QueryCache:
+    """
+    TTL cache with least-recently-used eviction.
+
+    Entries older than the TTL are treated as misses. When the cache is
+    full, the least recently used entry is evicted. With a shared store,
+    local misses fall through to it and every result is written to both.
+
+    Example:
+        >>> cache = QueryCache(ttl=600, max_size=256)
+        >>> await cache.set(("flights", "LAX", "NRT", "2026-01-15"), flights)
+        >>> await cache.get(("flights", "LAX", "NRT", "2026-01-15"))
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = 256,
+        store: Optional[RedisCacheStore] = None,
+    ):
+        """
+        Args:
+            ttl: Seconds an entry stays fresh
+            max_size: Maximum number of entries kept in process
+            store: Optional shared store consulted on local misses
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.store = store
+        self._entries: OrderedDict[Hashable, tuple[float, list]] = OrderedDict()
+
+    async def get(self, key: Hashable) -> Optional[list]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Normalized query key
+
+        Returns:
+            Copy of the cached result list, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                return list(value)
+            del self._entries[key]
+
+        if self.store is None:
+            return None
+
+        shared = await self.store.get(key)
+        if shared is None:
+            return None
+
+        # Keep the shared entry's remaining lifetime rather than a fresh TTL
+        expires_at, value = shared
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return None
+        self._remember(key, value, time.monotonic() + remaining)
+        return list(value)
+
+    async def set(self, key: Hashable, value: list) -> None:
+        """
+        Store a copy of a result, evicting the least recently used entries
+        when full.
+
+        Args:
+            key: Normalized query key
+            value: Result list to cache
+        """
+        value = list(value)
+        self._remember(key, value, time.monotonic() + self.ttl)
+        if self.store is not None:
+            await self.store.set(key, value, self.ttl)
+
+    def _remember(self, key: Hashable, value: list, expires_at: float) -> None:
+        # No awaits here, so concurrent tasks cannot interleave mid-update
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all in-process entries (the shared store is left as is)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,70 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Travel Models
+
+Search results travel between agents as JSON, so search functions return
+plain dictionaries; their shapes are documented by the *Result TypedDicts
+below.
+"""
+
+from typing import NotRequired, Optional, TypedDict
+
+
+class ReturnFlightResult(TypedDict):
+    """Return leg of a round trip, as returned by the SerpAPI search tools."""
+    departure_time: str
+    departure_code: str
+    arrival_time: str
+    arrival_code: str
+    airline: str
+    stops: int
+    duration_minutes: int
+    price: NotRequired[float]  # Only set on separately searched return flights
+
+
+class FlightResult(TypedDict):
+    """Flight option as returned by search_flights."""
+    price: float
+    departure_time: str
+    departure_code: str
+    arrival_time: str  # Time when traveler arrives at destination
+    arrival_code: str
+    airline: str
+    duration_minutes: int
+    stops: int
+    layover_codes: list[str]  # Outbound connection airports, in travel order
+    flights: NotRequired[list[dict]]  # Full leg data, only with include_raw=True
+    return_flight: Optional[ReturnFlightResult]
+
+
+class HotelResult(TypedDict):
+    """Hotel option as returned by search_hotels."""
+    name: str
+    price: float
+    rating: float
+    overall_rating: float
+    location_rating: float
+    hotel_class: int
+    check_in_time: str
+    check_in_date: str
+    amenities: NotRequired[list]  # Only with include_amenities=True
+
+
+class ActivityResult(TypedDict):
+    """Activity or place as returned by search_activities."""
+    name: str
+    address: str
+    rating: float
+    reviews: int
+    type: str
+    description: str
+    hours: str
+    phone: str
+    website: str
+    thumbnail: str
+    price_level: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+
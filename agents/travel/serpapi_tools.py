@@ -10,17 +10,393 @@ It handles API calls, response parsing, and data normalization.
 Key functions:
 - search_flights: Search for flights between origin and destination
 - search_hotels: Search for hotels at a destination location
+- search_activities: Search for activities and attractions at a destination
+- search_trip_bundle: Run the flight, hotel, and activity searches concurrently
 """
 
+import asyncio
 import logging
+import math
+import random
+import re
 import httpx
-from typing import Optional
-from datetime import datetime
+import ijson
+import orjson
+from functools import lru_cache, partial
+from itertools import chain
+from types import MappingProxyType
+from typing import Awaitable, Callable, Optional, TypeVar
+from datetime import datetime, timedelta
 
-from config.config import SERPAPI_API_KEY, SERPAPI_BASE_URL
+from agents.exceptions import SerpAPIError
+from agents.travel.cache import QueryCache, RedisCacheStore
+from agents.travel.models import (
+    ActivityResult,
+    FlightResult,
+    HotelResult,
+    ReturnFlightResult,
+)
+from config.config import (
+    SERPAPI_API_KEY,
+    SERPAPI_BASE_URL,
+    SERPAPI_CACHE_REDIS_URL,
+    SERPAPI_HTTP2_ENABLED,
+    SERPAPI_MAX_CONCURRENT_REQUESTS,
+)
 
 logger = logging.getLogger("lungo.travel.serpapi_tools")
 
+T = TypeVar("T")
+
+# Currency symbols, thousands separators and whitespace in price strings
+# (e.g., "$1,234" -> "1234")
+_PRICE_STRIP_RE = re.compile(r"[$,\s]+")
+
+# Errors raised by malformed entries in a SerpAPI payload (wrong value types,
+# empty leg lists, unparseable prices). The _parse_* helpers skip such entries;
+# anything else is a bug and should propagate.
+_PARSE_ERRORS = (AttributeError, LookupError, TypeError, ValueError)
+
+# Shared read-only default for nested lookups like .get("departure_airport", _EMPTY),
+# so missing fields don't allocate a fresh {} on every parsed entry
+_EMPTY = MappingProxyType({})
+
+# SerpAPI responses at least this large (or of unknown length) are
+# parsed incrementally instead of being decoded in one go
+_STREAM_MIN_BYTES = 256 * 1024
+
+# Retry policy for rate limits (429), gateway errors and connection failures.
+# A plain 500 is not retried: SerpAPI answers with 500 when it cannot handle
+# the query itself (e.g. unsupported parameter combinations), which fails the
+# same way on every attempt. Transient upstream trouble surfaces as 502/503/504.
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Cap on SerpAPI requests in flight from this process. Concurrent searches
+# beyond the cap queue here instead of tripping SerpAPI's rate limit (429s,
+# and the backoff that follows, cost more than a short wait).
+_SERPAPI_SEMAPHORE = asyncio.Semaphore(SERPAPI_MAX_CONCURRENT_REQUESTS)
+
+# Fixed SerpAPI request parameters per search kind; each call merges in its
+# own API key and query values
+# engine=google_flights: Use Google Flights data source
+# sort_by=2: Sort flights by price (lowest first)
+_FLIGHTS_BASE_PARAMS = MappingProxyType({
+    "engine": "google_flights",
+    "sort_by": "2",
+    "currency": "USD",
+})
+# engine=google_hotels: Use Google Hotels data source
+# sort_by=3: Sort hotels by lowest price
+_HOTELS_BASE_PARAMS = MappingProxyType({
+    "engine": "google_hotels",
+    "sort_by": "3",
+    "currency": "USD",
+})
+# engine=google_local: Use Google Local/Maps data source for activities
+_ACTIVITIES_BASE_PARAMS = MappingProxyType({"engine": "google_local"})
+
+# Shared HTTP client for all SerpAPI calls. Created lazily on first use and
+# reused so repeated searches keep their connections to serpapi.com alive
+# instead of paying a TCP + TLS handshake per request.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared SerpAPI HTTP client.
+    
+    Returns:
+        The shared httpx.AsyncClient (pooled connections, HTTP/2 unless
+        disabled with SERPAPI_HTTP2_ENABLED)
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            http2=SERPAPI_HTTP2_ENABLED,
+            # Never more connections than requests allowed in flight
+            limits=httpx.Limits(
+                max_keepalive_connections=SERPAPI_MAX_CONCURRENT_REQUESTS,
+                max_connections=SERPAPI_MAX_CONCURRENT_REQUESTS,
+            ),
+        )
+    return _CLIENT
+
+
+async def aclose_serpapi_client() -> None:
+    """
+    Close the shared SerpAPI HTTP client and the shared result cache connection.
+    
+    Call this from the application's shutdown path to release pooled connections.
+    """
+    global _CLIENT
+    try:
+        if _CLIENT is not None:
+            client, _CLIENT = _CLIENT, None
+            await client.aclose()
+    finally:
+        # Release the cache pool even if closing the HTTP client failed
+        if _SHARED_CACHE_STORE is not None:
+            await _SHARED_CACHE_STORE.aclose()
+
+
+def _retry_delay(error: httpx.HTTPError, attempt: int) -> Optional[float]:
+    """
+    Decide whether a failed SerpAPI request should be retried.
+    
+    Transport errors and statuses in _RETRY_STATUS_CODES are transient; other
+    error statuses, including 500, are not (see _RETRY_STATUS_CODES).
+    
+    Args:
+        error: The error raised by the request
+        attempt: Zero-based index of the attempt that failed
+    
+    Returns:
+        Seconds to wait before retrying, or None if the error is not transient
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code not in _RETRY_STATUS_CODES:
+            return None
+        # Honor the server's Retry-After (seconds form) when it sends one
+        retry_after = error.response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _RETRY_MAX_DELAY)
+    elif not isinstance(error, httpx.TransportError):
+        return None
+    
+    # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+    return min(_RETRY_BASE_DELAY * 2 ** attempt + random.random(), _RETRY_MAX_DELAY)
+
+
+def _response_error(response: httpx.Response) -> Optional[str]:
+    """
+    Extract SerpAPI's "error" message from a fully read error response.
+    
+    Args:
+        response: The response of a failed SerpAPI request
+    
+    Returns:
+        The error message, or None if the body is unread or carries none
+    """
+    try:
+        error = _decode_json(response).get("error")
+    except (httpx.ResponseNotRead, ValueError, AttributeError):
+        return None
+    return error if isinstance(error, str) else None
+
+
+def _http_error_reason(error: httpx.HTTPError) -> str:
+    """
+    Describe an HTTP error without its request URL, which carries the API key.
+    
+    Args:
+        error: The error raised by a SerpAPI request
+    
+    Returns:
+        "HTTP <status>" for error responses, followed by SerpAPI's error
+        message when the body has one, else the exception type name
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        reason = f"HTTP {error.response.status_code}"
+        message = _response_error(error.response)
+        return f"{reason}: {message}" if message else reason
+    return type(error).__name__
+
+
+async def _with_retries(fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a SerpAPI request, retrying rate limits and transient failures.
+    
+    Each attempt holds a slot of the process-wide request cap; backoff waits
+    between attempts do not.
+    
+    Args:
+        fetch: Coroutine function performing one complete request
+    
+    Returns:
+        The result of the first successful attempt
+    
+    Raises:
+        httpx.HTTPError: If the last attempt fails or the error is not transient
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            async with _SERPAPI_SEMAPHORE:
+                return await fetch()
+        except httpx.HTTPError as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            logger.warning(
+                "SerpAPI request failed (%s), retrying in %.1fs (attempt %s/%s)",
+                _http_error_reason(e), delay, attempt + 1, _RETRY_ATTEMPTS,
+            )
+            await asyncio.sleep(delay)
+
+
+def _decode_json(response: httpx.Response):
+    """Decode a fully read response body with orjson."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        # orjson only accepts UTF-8; let httpx handle other encodings
+        return response.json()
+
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper over a streamed response body for ijson."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _raise_serpapi_error(error) -> None:
+    """Log and raise an error reported in a SerpAPI response body."""
+    logger.error("SerpAPI error: %s", error)
+    raise SerpAPIError(f"SerpAPI error: {error}")
+
+
+async def _fetch_serpapi_results(
+    params: dict,
+    results_keys: tuple[str, ...],
+    parse: Callable[[dict], Optional[dict]],
+) -> list[dict]:
+    """
+    Fetch SerpAPI result lists and parse each entry.
+    
+    Flight, hotel, and local search responses can be several MB when they
+    contain hundreds of entries. Responses of at least _STREAM_MIN_BYTES (or
+    of unknown length) are parsed incrementally with ijson as the body
+    arrives, so only one raw entry is held in memory at a time; smaller
+    responses are decoded in one go with orjson.
+    
+    Args:
+        params: SerpAPI query parameters
+        results_keys: Top-level keys holding result lists, in the order their
+                      entries should be returned (e.g., ("best_flights", "other_flights"))
+        parse: Function normalizing one raw entry, returning None to skip it
+    
+    Returns:
+        Parsed results, in results_keys order
+    
+    Raises:
+        SerpAPIError: If the response body reports an error
+        httpx.HTTPError: If the request fails or returns an error status
+                         (after retrying transient failures)
+    """
+    async def fetch() -> list[dict]:
+        client = await _get_client()
+        async with client.stream("GET", SERPAPI_BASE_URL, params=params) as response:
+            if response.is_error:
+                # Error bodies are small; read them so the error message
+                # SerpAPI sends can be reported (see _http_error_reason)
+                await response.aread()
+                response.raise_for_status()
+            
+            content_length = response.headers.get("content-length")
+            if content_length is not None and int(content_length) < _STREAM_MIN_BYTES:
+                await response.aread()
+                data = _decode_json(response)
+                if "error" in data:
+                    # Error responses carry no results worth parsing
+                    _raise_serpapi_error(data["error"])
+                entries = chain.from_iterable(data.get(key, []) for key in results_keys)
+                return [result for result in map(parse, entries) if result]
+            
+            # Results are grouped per key so they come back in results_keys
+            # order regardless of the key order in the response body
+            results_by_prefix = {f"{key}.item": [] for key in results_keys}
+            current = None
+            builder = None
+            depth = 0
+            events = ijson.parse_async(_AsyncByteReader(response), use_float=True)
+            async for prefix, event, value in events:
+                if builder is not None:
+                    # Inside a result entry - rebuild it, then parse once complete
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                        if depth == 0:
+                            result = parse(builder.value)
+                            if result:
+                                current.append(result)
+                            builder = None
+                elif prefix in results_by_prefix:
+                    current = results_by_prefix[prefix]
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        depth = 1
+                    else:
+                        result = parse(value)
+                        if result:
+                            current.append(result)
+                elif prefix == "error":
+                    # Any error fails the search, so stop reading the body as
+                    # soon as the error value is known
+                    _raise_serpapi_error(
+                        None if event in ("start_map", "start_array") else value
+                    )
+            return list(chain.from_iterable(results_by_prefix.values()))
+    
+    return await _with_retries(fetch)
+
+
+@lru_cache(maxsize=1024)
+def _norm_code(value: str) -> str:
+    """Normalize an airport code or city for SerpAPI params and cache keys."""
+    return value.upper()
+
+
+@lru_cache(maxsize=1024)
+def _norm_query(value: str) -> str:
+    """Normalize a free-text location or activity query for cache keys."""
+    return value.lower().strip()
+
+
+# In-process caches of successful search results, keyed by normalized query.
+# Repeated searches for the same route/dates within the TTL are served from
+# memory instead of another SerpAPI round trip. Failures and empty results
+# are never cached, so a transient "no results" is retried on the next call.
+# With SERPAPI_CACHE_REDIS_URL set, results are also shared through Redis.
+_FLIGHTS_CACHE_TTL = 10 * 60  # seconds - flight prices move quickly
+_HOTELS_CACHE_TTL = 30 * 60
+_ACTIVITIES_CACHE_TTL = 30 * 60
+
+_SHARED_CACHE_STORE = (
+    RedisCacheStore(SERPAPI_CACHE_REDIS_URL) if SERPAPI_CACHE_REDIS_URL else None
+)
+
+_flights_cache = QueryCache(ttl=_FLIGHTS_CACHE_TTL, store=_SHARED_CACHE_STORE)
+_return_flights_cache = QueryCache(ttl=_FLIGHTS_CACHE_TTL, store=_SHARED_CACHE_STORE)
+_hotels_cache = QueryCache(ttl=_HOTELS_CACHE_TTL, store=_SHARED_CACHE_STORE)
+_activities_cache = QueryCache(ttl=_ACTIVITIES_CACHE_TTL, store=_SHARED_CACHE_STORE)
+
+
+def invalidate_cache() -> None:
+    """
+    Drop all cached flight, hotel, and activity results held in process.
+    
+    Useful in tests and after changing SerpAPI credentials or parameters,
+    where stale results must not be served. Entries shared through Redis
+    are left to expire on their TTL.
+    """
+    _flights_cache.clear()
+    _return_flights_cache.clear()
+    _hotels_cache.clear()
+    _activities_cache.clear()
+
 
 async def search_flights(
     origin: str,
@@ -28,7 +404,9 @@ async def search_flights(
     outbound_date: str,
     return_date: str = None,
     include_return_flights: bool = True,
-) -> list[dict]:
+    force_refresh: bool = False,
+    include_raw: bool = False,
+) -> list[FlightResult]:
     """
     Search for flights using SerpAPI's Google Flights engine.
     
@@ -46,6 +424,9 @@ async def search_flights(
         return_date: Return date in YYYY-MM-DD format (optional for one-way)
         include_return_flights: If True, fetch return flight options for round-trip (default: True)
                                Set to False for one-way flights.
+        force_refresh: If True, skip the result cache and query SerpAPI (default: False)
+        include_raw: If True, keep the full SerpAPI leg data in each result's
+                     "flights" field (default: False)
     
     Returns:
         List of flight dictionaries containing:
@@ -55,11 +436,12 @@ async def search_flights(
         - airline: Primary airline name
         - duration_minutes: Total flight duration
         - stops: Number of stops
-        - flights: Full flight legs data from API
+        - layover_codes: Airport codes of the outbound connections
+        - flights: Full flight legs data from API (only if include_raw=True)
         - return_flight: Best matching return flight info (if include_return_flights=True and round-trip)
     
     Raises:
-        Exception: If SerpAPI call fails or returns an error
+        SerpAPIError: If SerpAPI call fails or returns an error
     
     Example (round-trip):
         >>> flights = await search_flights("LAX", "NRT", "2026-01-15", "2026-01-22")
@@ -73,86 +455,110 @@ async def search_flights(
     is_one_way = not include_return_flights or not return_date
     trip_type = "one-way" if is_one_way else "round-trip"
     
-    logger.info(f"Searching {trip_type} flights: {origin} -> {destination}, {outbound_date}" + 
-                (f" to {return_date}" if return_date and not is_one_way else ""))
+    logger.info(
+        "Searching %s flights: %s -> %s, %s%s",
+        trip_type, origin, destination, outbound_date,
+        f" to {return_date}" if return_date and not is_one_way else "",
+    )
     
     # Validate API key is configured
     if not SERPAPI_API_KEY:
         logger.error("SERPAPI_API_KEY is not configured")
         raise ValueError("SerpAPI key is not configured. Please set SERPAPI_API_KEY in your environment.")
     
+    origin_code = _norm_code(origin)
+    destination_code = _norm_code(destination)
+    cache_key = (
+        "flights",
+        origin_code,
+        destination_code,
+        outbound_date,
+        return_date or "",
+        bool(include_return_flights),
+        bool(include_raw),
+    )
+    cached = None if force_refresh else await _flights_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning %s cached flights", len(cached))
+        return cached
+    
     # Build SerpAPI request parameters
-    # engine=google_flights: Use Google Flights data source
     # type=1: Round trip flight search
     # type=2: One way flight search
-    # sort_by=2: Sort results by price (lowest first)
     params = {
-        "engine": "google_flights",
+        **_FLIGHTS_BASE_PARAMS,
         "api_key": SERPAPI_API_KEY,
-        "departure_id": origin.upper(),  # Airport codes should be uppercase
-        "arrival_id": destination.upper(),
+        "departure_id": origin_code,  # Airport codes should be uppercase
+        "arrival_id": destination_code,
         "outbound_date": outbound_date,
         "type": "2" if is_one_way else "1",  # 1 = Round trip, 2 = One way
-        "sort_by": "2",  # Sort by price
-        "currency": "USD",
     }
     
     # Only include return_date for round-trip searches
     if not is_one_way and return_date:
         params["return_date"] = return_date
     
+    # For round trips, the return leg search only depends on the trip inputs,
+    # so start it now and let it run while the outbound search is in flight
+    # This makes a separate search for the return leg to get actual return times
+    return_task = None
+    if not is_one_way:
+        return_task = asyncio.create_task(
+            _search_return_flights(
+                destination, origin, return_date, force_refresh=force_refresh
+            )
+        )
+    
     try:
         # Make async HTTP request to SerpAPI for outbound flights
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SERPAPI_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        # Check for API errors in response
-        if "error" in data:
-            logger.error(f"SerpAPI error: {data['error']}")
-            raise Exception(f"SerpAPI error: {data['error']}")
-        
         # Combine best_flights and other_flights for comprehensive results
         # best_flights: SerpAPI's recommended flights
         # other_flights: Additional flight options
-        all_flights = []
-        best_flights = data.get("best_flights", [])
-        other_flights = data.get("other_flights", [])
-        
-        for flight_group in best_flights + other_flights:
-            flight_info = _parse_flight(flight_group)
-            if flight_info:
-                all_flights.append(flight_info)
+        all_flights = await _fetch_serpapi_results(
+            params,
+            ("best_flights", "other_flights"),
+            partial(_parse_flight, include_raw=include_raw),
+        )
         
-        logger.info(f"Found {len(all_flights)} outbound flights")
+        logger.info("Found %s outbound flights", len(all_flights))
         
-        # Fetch return flight options if requested (only for round-trip flights)
-        # This makes a separate search for the return leg to get actual return times
+        # Attach return flight options (only for round-trip flights)
         # Skip for one-way flights (is_one_way=True or no return_date)
-        if include_return_flights and all_flights and return_date and not is_one_way:
-            return_flights = await _search_return_flights(
-                destination, origin, return_date
-            )
+        if return_task is not None and all_flights:
+            return_flights = await return_task
             
             # Match return flights to outbound flights by airline if possible
+            # The match only depends on the outbound airline and stop count,
+            # so look it up once per distinct (airline, stops) pair
+            return_index = _index_return_flights(return_flights)
+            best_by_key: dict[tuple[str, int], Optional[ReturnFlightResult]] = {}
             for flight in all_flights:
-                flight["return_flight"] = _find_best_return_flight(
-                    flight, return_flights
-                )
+                key = (flight.get("airline", "").lower(), flight.get("stops", 0))
+                if key not in best_by_key:
+                    best_by_key[key] = _find_best_return_flight(flight, return_index)
+                flight["return_flight"] = best_by_key[key]
         
+        if all_flights:
+            await _flights_cache.set(cache_key, all_flights)
         return all_flights
         
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error searching flights: {e}")
-        raise Exception(f"Failed to search flights: {e}")
+        reason = _http_error_reason(e)
+        logger.error("HTTP error searching flights: %s", reason)
+        raise SerpAPIError(f"Failed to search flights: {reason}") from e
+    finally:
+        # No need to finish the return search if the outbound search failed
+        # or found no flights to pair it with
+        if return_task is not None and not return_task.done():
+            return_task.cancel()
 
 
 async def _search_return_flights(
     origin: str,
     destination: str,
     departure_date: str,
-) -> list[dict]:
+    force_refresh: bool = False,
+) -> list[ReturnFlightResult]:
     """
     Search for one-way return flights.
     
@@ -162,52 +568,48 @@ async def _search_return_flights(
         origin: Return flight departure (original destination)
         destination: Return flight arrival (original origin)
         departure_date: Return date in YYYY-MM-DD format
+        force_refresh: If True, skip the result cache and query SerpAPI
     
     Returns:
         List of return flight options
     """
-    logger.info(f"Searching return flights: {origin} -> {destination}, {departure_date}")
+    logger.info("Searching return flights: %s -> %s, %s", origin, destination, departure_date)
+    
+    cache_key = ("return_flights", _norm_code(origin), _norm_code(destination), departure_date)
+    cached = None if force_refresh else await _return_flights_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning %s cached return flight options", len(cached))
+        return cached
     
     # Build SerpAPI request for one-way return flight
     params = {
-        "engine": "google_flights",
+        **_FLIGHTS_BASE_PARAMS,
         "api_key": SERPAPI_API_KEY,
-        "departure_id": origin.upper(),
-        "arrival_id": destination.upper(),
+        "departure_id": _norm_code(origin),
+        "arrival_id": _norm_code(destination),
         "outbound_date": departure_date,
         "type": "2",  # 2 = One way
-        "sort_by": "2",  # Sort by price
-        "currency": "USD",
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SERPAPI_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        if "error" in data:
-            logger.warning(f"SerpAPI error for return flights: {data['error']}")
-            return []
-        
-        return_flights = []
-        best_flights = data.get("best_flights", [])
-        other_flights = data.get("other_flights", [])
-        
-        for flight_group in best_flights + other_flights:
-            flight_info = _parse_return_flight(flight_group)
-            if flight_info:
-                return_flights.append(flight_info)
+        return_flights = await _fetch_serpapi_results(
+            params, ("best_flights", "other_flights"), _parse_return_flight
+        )
         
-        logger.info(f"Found {len(return_flights)} return flight options")
+        logger.info("Found %s return flight options", len(return_flights))
+        if return_flights:
+            await _return_flights_cache.set(cache_key, return_flights)
         return return_flights
         
+    except httpx.HTTPError as e:
+        logger.warning("Failed to fetch return flights: %s", _http_error_reason(e))
+        return []
     except Exception as e:
-        logger.warning(f"Failed to fetch return flights: {e}")
+        logger.warning("Failed to fetch return flights: %s", e)
         return []
 
 
-def _parse_return_flight(flight_group: dict) -> Optional[dict]:
+def _parse_return_flight(flight_group: dict) -> Optional[ReturnFlightResult]:
     """
     Parse a return flight from SerpAPI response.
     
@@ -218,15 +620,15 @@ def _parse_return_flight(flight_group: dict) -> Optional[dict]:
         Parsed return flight info or None
     """
     try:
-        flights = flight_group.get("flights", [])
+        flights = flight_group.get("flights", ())
         if not flights:
             return None
         
         first_flight = flights[0]
         last_flight = flights[-1]
         
-        departure_airport = first_flight.get("departure_airport", {})
-        arrival_airport = last_flight.get("arrival_airport", {})
+        departure_airport = first_flight.get("departure_airport", _EMPTY)
+        arrival_airport = last_flight.get("arrival_airport", _EMPTY)
         
         return {
             "departure_time": departure_airport.get("time", ""),
@@ -238,12 +640,45 @@ def _parse_return_flight(flight_group: dict) -> Optional[dict]:
             "duration_minutes": flight_group.get("total_duration", 0),
             "price": flight_group.get("price", 0),  # One-way price (for reference)
         }
-    except Exception as e:
-        logger.warning(f"Failed to parse return flight: {e}")
+    except _PARSE_ERRORS as e:
+        logger.warning("Failed to parse return flight: %s", e)
         return None
 
 
-def _find_best_return_flight(outbound: dict, return_flights: list[dict]) -> Optional[dict]:
+def _index_return_flights(
+    return_flights: list[ReturnFlightResult],
+) -> tuple[dict, dict]:
+    """
+    Index return flights for matching against outbound flights.
+    
+    A return flight's score only depends on whether its airline matches and
+    on its stop count, so the best match is always the first-listed flight
+    of some stop count, either overall or for the outbound airline. Keeping
+    just those lets each lookup check a handful of stop counts instead of
+    rescoring the whole pool.
+    
+    Args:
+        return_flights: Available return flight options
+    
+    Returns:
+        Tuple of (stops -> (position, first flight with that stop count),
+        (lowercased airline, stops) -> (position, first such flight))
+    """
+    first_by_stops = {}
+    first_by_airline_stops = {}
+    for position, rf in enumerate(return_flights):
+        stops = rf.get("stops", 0)
+        first_by_stops.setdefault(stops, (position, rf))
+        first_by_airline_stops.setdefault(
+            (rf.get("airline", "").lower(), stops), (position, rf)
+        )
+    return first_by_stops, first_by_airline_stops
+
+
+def _find_best_return_flight(
+    outbound: FlightResult,
+    index: tuple[dict, dict],
+) -> Optional[ReturnFlightResult]:
     """
     Find the best matching return flight for an outbound flight.
     
@@ -252,44 +687,45 @@ def _find_best_return_flight(outbound: dict, return_flights: list[dict]) -> Opti
     2. Similar number of stops
     3. Reasonable departure time
     
+    Ties go to the return flight listed first.
+    
     Args:
         outbound: The outbound flight
-        return_flights: Available return flight options
+        index: Return flight index from _index_return_flights
     
     Returns:
         Best matching return flight or None
     """
-    if not return_flights:
-        return None
-    
+    first_by_stops, first_by_airline_stops = index
     outbound_airline = outbound.get("airline", "").lower()
     outbound_stops = outbound.get("stops", 0)
     
-    # Score each return flight
-    scored_flights = []
-    for rf in return_flights:
-        score = 0
-        
-        # Prefer same airline
-        if rf.get("airline", "").lower() == outbound_airline:
-            score += 10
-        
+    best_key = None
+    best = None
+    for rf_stops, first in first_by_stops.items():
         # Prefer similar number of stops
-        stops_diff = abs(rf.get("stops", 0) - outbound_stops)
-        score -= stops_diff * 2
+        score = -abs(rf_stops - outbound_stops) * 2
         
         # Prefer non-stop if outbound is non-stop
-        if outbound_stops == 0 and rf.get("stops", 0) == 0:
+        if outbound_stops == 0 and rf_stops == 0:
             score += 5
         
-        scored_flights.append((score, rf))
+        # Prefer same airline
+        same_airline = first_by_airline_stops.get((outbound_airline, rf_stops))
+        if same_airline is not None:
+            score += 10
+            first = same_airline
+        
+        position, rf = first
+        key = (score, -position)
+        if best_key is None or key > best_key:
+            best_key = key
+            best = rf
     
-    # Sort by score (highest first) and return best match
-    scored_flights.sort(key=lambda x: x[0], reverse=True)
-    return scored_flights[0][1] if scored_flights else None
+    return best
 
 
-def _parse_flight(flight_group: dict) -> Optional[dict]:
+def _parse_flight(flight_group: dict, include_raw: bool = False) -> Optional[FlightResult]:
     """
     Parse a flight group from SerpAPI response into a normalized format.
     
@@ -301,38 +737,40 @@ def _parse_flight(flight_group: dict) -> Optional[dict]:
     
     Args:
         flight_group: Raw flight data from SerpAPI response
+        include_raw: If True, include the full leg data as "flights"
     
     Returns:
         Normalized flight dictionary or None if parsing fails
     """
     try:
-        flights = flight_group.get("flights", [])
+        get = flight_group.get
+        flights = get("flights", ())
         if not flights:
             return None
         
         # Get price from flight group
-        price = flight_group.get("price", 0)
+        price = get("price", 0)
         
         # First flight is departure, last flight is arrival at destination
         first_flight = flights[0]
         last_flight = flights[-1]  # Last leg of outbound journey
         
         # Extract OUTBOUND flight info
-        departure_airport = first_flight.get("departure_airport", {})
+        departure_airport = first_flight.get("departure_airport", _EMPTY)
         departure_time = departure_airport.get("time", "")
         departure_code = departure_airport.get("id", "")
         
-        arrival_airport = last_flight.get("arrival_airport", {})
+        arrival_airport = last_flight.get("arrival_airport", _EMPTY)
         arrival_time = arrival_airport.get("time", "")
         arrival_code = arrival_airport.get("id", "")
         
         # Get airline and flight details
         airline = first_flight.get("airline", "Unknown")
-        total_duration = flight_group.get("total_duration", 0)
+        total_duration = get("total_duration", 0)
         
         # Extract RETURN flight info if available
         # SerpAPI includes return flights in "return_flights" for round trips
-        return_flights = flight_group.get("return_flights", [])
+        return_flights = get("return_flights", ())
         return_flight_info = None
         
         if return_flights:
@@ -340,8 +778,8 @@ def _parse_flight(flight_group: dict) -> Optional[dict]:
             return_first = return_flights[0]
             return_last = return_flights[-1]
             
-            return_departure_airport = return_first.get("departure_airport", {})
-            return_arrival_airport = return_last.get("arrival_airport", {})
+            return_departure_airport = return_first.get("departure_airport", _EMPTY)
+            return_arrival_airport = return_last.get("arrival_airport", _EMPTY)
             
             return_flight_info = {
                 "departure_time": return_departure_airport.get("time", ""),
@@ -350,10 +788,10 @@ def _parse_flight(flight_group: dict) -> Optional[dict]:
                 "arrival_code": return_arrival_airport.get("id", ""),
                 "airline": return_first.get("airline", airline),  # May be different airline
                 "stops": len(return_flights) - 1,
-                "duration_minutes": flight_group.get("return_duration", 0),
+                "duration_minutes": get("return_duration", 0),
             }
         
-        return {
+        flight_info = {
             "price": price,
             # Outbound flight details
             "departure_time": departure_time,
@@ -363,12 +801,20 @@ def _parse_flight(flight_group: dict) -> Optional[dict]:
             "airline": airline,
             "duration_minutes": total_duration,
             "stops": len(flights) - 1,  # Number of connections
-            "flights": flights,  # Full flight leg data for reference
+            # Airports where the traveler changes planes on the way out
+            "layover_codes": [
+                leg.get("arrival_airport", _EMPTY).get("id", "") for leg in flights[:-1]
+            ],
             # Return flight details (None if one-way or not available)
             "return_flight": return_flight_info,
         }
-    except Exception as e:
-        logger.warning(f"Failed to parse flight: {e}")
+        # The raw legs roughly double the size of each result (and of the A2A
+        # response built from it), so only keep them when asked
+        if include_raw:
+            flight_info["flights"] = flights  # Full flight leg data for reference
+        return flight_info
+    except _PARSE_ERRORS as e:
+        logger.warning("Failed to parse flight: %s", e)
         return None
 
 
@@ -376,7 +822,10 @@ async def search_hotels(
     location: str,
     check_in_date: str,
     check_out_date: str,
-) -> list[dict]:
+    force_refresh: bool = False,
+    include_amenities: bool = False,
+    max_price: Optional[float] = None,
+) -> list[HotelResult]:
     """
     Search for hotels using SerpAPI's Google Hotels engine.
     
@@ -387,6 +836,10 @@ async def search_hotels(
         location: City name or specific location (e.g., "Tokyo", "Paris, France")
         check_in_date: Check-in date in YYYY-MM-DD format
         check_out_date: Check-out date in YYYY-MM-DD format
+        force_refresh: If True, skip the result cache and query SerpAPI (default: False)
+        include_amenities: If True, keep each hotel's amenity list (default: False)
+        max_price: Optional price ceiling in USD; pricier hotels are left out
+                   of the response and skipped while parsing (default: None)
     
     Returns:
         List of hotel dictionaries containing:
@@ -395,66 +848,78 @@ async def search_hotels(
         - rating: Hotel rating (if available)
         - check_in_time: Expected check-in time (default: "15:00" if not specified)
         - check_in_date: The check-in date
-        - amenities: List of hotel amenities
+        - amenities: List of hotel amenities (only if include_amenities=True)
     
     Raises:
-        Exception: If SerpAPI call fails or returns an error
+        SerpAPIError: If SerpAPI call fails or returns an error
     
     Example:
         >>> hotels = await search_hotels("Tokyo", "2026-01-15", "2026-01-22")
         >>> print(hotels[0]["name"], hotels[0]["price"])
     """
-    logger.info(f"Searching hotels in {location}, {check_in_date} to {check_out_date}")
+    logger.info("Searching hotels in %s, %s to %s", location, check_in_date, check_out_date)
     
     # Validate API key is configured
     if not SERPAPI_API_KEY:
         logger.error("SERPAPI_API_KEY is not configured")
         raise ValueError("SerpAPI key is not configured. Please set SERPAPI_API_KEY in your environment.")
     
+    cache_key = (
+        "hotels",
+        _norm_query(location),
+        check_in_date,
+        check_out_date,
+        bool(include_amenities),
+        max_price,
+    )
+    cached = None if force_refresh else await _hotels_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning %s cached hotels", len(cached))
+        return cached
+    
     # Build SerpAPI request parameters
-    # engine=google_hotels: Use Google Hotels data source
-    # sort_by=3: Sort by lowest price
     params = {
-        "engine": "google_hotels",
+        **_HOTELS_BASE_PARAMS,
         "api_key": SERPAPI_API_KEY,
         "q": location,  # Location query string
         "check_in_date": check_in_date,
         "check_out_date": check_out_date,
-        "sort_by": "3",  # Sort by lowest price
-        "currency": "USD",
     }
+    if max_price is not None:
+        # Let SerpAPI drop pricier properties before they are sent at all
+        params["max_price"] = math.ceil(max_price)
     
     try:
-        # Make async HTTP request to SerpAPI
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SERPAPI_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        # Check for API errors in response
-        if "error" in data:
-            logger.error(f"SerpAPI error: {data['error']}")
-            raise Exception(f"SerpAPI error: {data['error']}")
-        
-        # Parse hotel properties from response
-        hotels = []
-        properties = data.get("properties", [])
-        
-        for prop in properties:
-            # Parse hotel info - price is as-is from API (per-night or total depending on API)
-            hotel_info = _parse_hotel(prop, check_in_date)
-            if hotel_info:
-                hotels.append(hotel_info)
-        
-        logger.info(f"Found {len(hotels)} hotels")
+        # Make async HTTP request to SerpAPI and parse hotel properties
+        # Price is as-is from API (per-night or total depending on API)
+        hotels = await _fetch_serpapi_results(
+            params,
+            ("properties",),
+            partial(
+                _parse_hotel,
+                check_in_date=check_in_date,
+                include_amenities=include_amenities,
+                max_price=max_price,
+            ),
+        )
+        
+        logger.info("Found %s hotels", len(hotels))
+        if hotels:
+            await _hotels_cache.set(cache_key, hotels)
         return hotels
         
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error searching hotels: {e}")
-        raise Exception(f"Failed to search hotels: {e}")
+        reason = _http_error_reason(e)
+        logger.error("HTTP error searching hotels: %s", reason)
+        raise SerpAPIError(f"Failed to search hotels: {reason}") from e
 
 
-def _parse_hotel(property_data: dict, check_in_date: str) -> Optional[dict]:
+def _parse_hotel(
+    property_data: dict,
+    check_in_date: str,
+    include_amenities: bool = False,
+    max_price: Optional[float] = None,
+) -> Optional[HotelResult]:
     """
     Parse a hotel property from SerpAPI response into a normalized format.
     
@@ -469,26 +934,33 @@ def _parse_hotel(property_data: dict, check_in_date: str) -> Optional[dict]:
     Args:
         property_data: Raw hotel property data from SerpAPI response
         check_in_date: The requested check-in date
+        include_amenities: If True, include the amenity list as "amenities"
+        max_price: Optional price ceiling in USD
     
     Returns:
-        Normalized hotel dictionary or None if parsing fails
+        Normalized hotel dictionary, or None if parsing fails or the hotel
+        costs more than max_price
     """
     try:
         name = property_data.get("name", "Unknown Hotel")
         
         # Extract price - may be in different formats
         # SerpAPI returns either 'rate_per_night' or 'total_rate'
-        rate_per_night = property_data.get("rate_per_night", {})
+        rate_per_night = property_data.get("rate_per_night", _EMPTY)
         price = rate_per_night.get("lowest", 0)
         
         # If no rate_per_night, try total_rate
         if not price:
-            total_rate = property_data.get("total_rate", {})
+            total_rate = property_data.get("total_rate", _EMPTY)
             price = total_rate.get("lowest", 0)
         
         # Extract numeric price from string if needed (e.g., "$150" -> 150)
         if isinstance(price, str):
-            price = float(price.replace("$", "").replace(",", "").strip() or 0)
+            price = float(_PRICE_STRIP_RE.sub("", price) or 0)
+        
+        # Skip the rest of the work for hotels that cannot fit the budget
+        if max_price is not None and price > max_price:
+            return None
         
         # Extract overall rating (1-5 scale)
         overall_rating = property_data.get("overall_rating", 0)
@@ -502,12 +974,15 @@ def _parse_hotel(property_data: dict, check_in_date: str) -> Optional[dict]:
         ratings_breakdown = property_data.get("ratings", [])
         
         if isinstance(ratings_breakdown, list):
-            for rating_item in ratings_breakdown:
-                if isinstance(rating_item, dict):
-                    rating_name = rating_item.get("name", "").lower()
-                    if "location" in rating_name:
-                        location_rating = rating_item.get("rating", 0) or 0
-                        break
+            location_rating = next(
+                (
+                    rating_item.get("rating", 0) or 0
+                    for rating_item in ratings_breakdown
+                    if isinstance(rating_item, dict)
+                    and "location" in rating_item.get("name", "").lower()
+                ),
+                0,
+            )
         
         # Also check for direct location_rating field
         if not location_rating:
@@ -517,13 +992,10 @@ def _parse_hotel(property_data: dict, check_in_date: str) -> Optional[dict]:
         # Default to 15:00 (3 PM) - standard hotel industry check-in time
         check_in_time = property_data.get("check_in_time", "15:00")
         
-        # Extract amenities for user reference
-        amenities = property_data.get("amenities", [])
-        
         # Extract hotel class/stars if available
         hotel_class = property_data.get("hotel_class", 0)
         
-        return {
+        hotel_info = {
             "name": name,
             "price": price,
             "rating": overall_rating,  # Overall rating (for backward compatibility)
@@ -532,17 +1004,22 @@ def _parse_hotel(property_data: dict, check_in_date: str) -> Optional[dict]:
             "hotel_class": hotel_class,  # Star rating (e.g., 3, 4, 5 stars)
             "check_in_time": check_in_time,
             "check_in_date": check_in_date,
-            "amenities": amenities,
         }
-    except Exception as e:
-        logger.warning(f"Failed to parse hotel: {e}")
+        # Nothing downstream reads amenities, and they are the bulk of each
+        # result, so only keep them when asked
+        if include_amenities:
+            hotel_info["amenities"] = property_data.get("amenities", [])
+        return hotel_info
+    except _PARSE_ERRORS as e:
+        logger.warning("Failed to parse hotel: %s", e)
         return None
 
 
 async def search_activities(
     location: str,
     activity_type: str = "things to do",
-) -> list[dict]:
+    force_refresh: bool = False,
+) -> list[ActivityResult]:
     """
     Search for activities and attractions using SerpAPI's Google Local engine.
     
@@ -554,6 +1031,7 @@ async def search_activities(
         activity_type: Type of activities to search for (default: "things to do")
                       Options: "things to do", "attractions", "tours", "museums",
                                "restaurants", "parks", "entertainment"
+        force_refresh: If True, skip the result cache and query SerpAPI (default: False)
     
     Returns:
         List of activity dictionaries containing:
@@ -569,57 +1047,50 @@ async def search_activities(
         - thumbnail: Image URL (if available)
     
     Raises:
-        Exception: If SerpAPI call fails or returns an error
+        SerpAPIError: If SerpAPI call fails or returns an error
     
     Example:
         >>> activities = await search_activities("San Jose, CA", "attractions")
         >>> print(activities[0]["name"], activities[0]["rating"])
     """
-    logger.info(f"Searching activities in {location}, type: {activity_type}")
+    logger.info("Searching activities in %s, type: %s", location, activity_type)
     
     # Validate API key is configured
     if not SERPAPI_API_KEY:
         logger.error("SERPAPI_API_KEY is not configured")
         raise ValueError("SerpAPI key is not configured. Please set SERPAPI_API_KEY in your environment.")
     
+    cache_key = ("activities", _norm_query(location), _norm_query(activity_type))
+    cached = None if force_refresh else await _activities_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning %s cached activities", len(cached))
+        return cached
+    
     # Build SerpAPI request parameters
-    # engine=google_local: Use Google Local/Maps data source for activities
     params = {
-        "engine": "google_local",
+        **_ACTIVITIES_BASE_PARAMS,
         "api_key": SERPAPI_API_KEY,
         "q": f"{activity_type} in {location}",
     }
     
     try:
-        # Make async HTTP request to SerpAPI
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SERPAPI_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        # Check for API errors in response
-        if "error" in data:
-            logger.error(f"SerpAPI error: {data['error']}")
-            raise Exception(f"SerpAPI error: {data['error']}")
-        
-        # Parse local results from response
-        activities = []
-        local_results = data.get("local_results", [])
-        
-        for place in local_results:
-            activity_info = _parse_activity(place)
-            if activity_info:
-                activities.append(activity_info)
-        
-        logger.info(f"Found {len(activities)} activities")
+        # Make async HTTP request to SerpAPI and parse local results
+        activities = await _fetch_serpapi_results(
+            params, ("local_results",), _parse_activity
+        )
+        
+        logger.info("Found %s activities", len(activities))
+        if activities:
+            await _activities_cache.set(cache_key, activities)
         return activities
         
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error searching activities: {e}")
-        raise Exception(f"Failed to search activities: {e}")
+        reason = _http_error_reason(e)
+        logger.error("HTTP error searching activities: %s", reason)
+        raise SerpAPIError(f"Failed to search activities: {reason}") from e
 
 
-def _parse_activity(place_data: dict) -> Optional[dict]:
+def _parse_activity(place_data: dict) -> Optional[ActivityResult]:
     """
     Parse an activity/place from SerpAPI response into a normalized format.
     
@@ -665,7 +1136,7 @@ def _parse_activity(place_data: dict) -> Optional[dict]:
         price_level = place_data.get("price", "")
         
         # Extract GPS coordinates if available
-        gps = place_data.get("gps_coordinates", {})
+        gps = place_data.get("gps_coordinates", _EMPTY)
         latitude = gps.get("latitude")
         longitude = gps.get("longitude")
         
@@ -684,6 +1155,95 @@ def _parse_activity(place_data: dict) -> Optional[dict]:
             "latitude": latitude,
             "longitude": longitude,
         }
-    except Exception as e:
-        logger.warning(f"Failed to parse activity: {e}")
+    except _PARSE_ERRORS as e:
+        logger.warning("Failed to parse activity: %s", e)
         return None
+
+
+def _default_check_out_date(outbound_date: str, return_date: Optional[str]) -> str:
+    """
+    Pick the hotel check-out date for a trip.
+    
+    Args:
+        outbound_date: Departure / hotel check-in date in YYYY-MM-DD format
+        return_date: Return date in YYYY-MM-DD format, if any
+    
+    Returns:
+        The return date, or the night after the outbound date for one-way trips
+    """
+    if return_date:
+        return return_date
+    try:
+        check_in = datetime.strptime(outbound_date.strip()[:10], "%Y-%m-%d")
+        return (check_in + timedelta(days=1)).strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        return outbound_date
+
+
+async def _gather_or_empty(label: str, *searches) -> list:
+    """
+    Await independent searches together, mapping each failure to an empty list.
+    
+    A failed search does not cancel the others; its error is logged and its
+    slot is returned as []. Cancellation and other BaseExceptions propagate.
+    
+    Args:
+        label: Prefix for the failure log line
+        *searches: Search coroutines, paired with (name, coroutine)
+    
+    Returns:
+        One result list per search, in the order given
+    """
+    names = [name for name, _ in searches]
+    results = await asyncio.gather(
+        *(search for _, search in searches), return_exceptions=True
+    )
+    for position, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.warning("%s %s search failed: %s", label, names[position], result)
+            results[position] = []
+        elif isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def search_trip_bundle(
+    origin: str,
+    destination: str,
+    outbound_date: str,
+    return_date: str = None,
+    include_return_flights: bool = True,
+    activity_type: str = "things to do",
+) -> dict:
+    """
+    Search flights, hotels, and activities for a trip concurrently.
+    
+    The three searches hit independent SerpAPI engines, so they are run
+    together and the total wait is the slowest search rather than the sum.
+    A failure in one search does not cancel the others; the failed field
+    is returned as an empty list and the error is logged.
+    
+    Args:
+        origin: Departure airport code or city name
+        destination: Arrival airport code or city name (also used for hotels
+                     and activities)
+        outbound_date: Departure / hotel check-in date in YYYY-MM-DD format
+        return_date: Return / hotel check-out date in YYYY-MM-DD format
+                     (optional for one-way; hotels then default to one night)
+        include_return_flights: If True, fetch return flight options (default: True)
+        activity_type: Type of activities to search for (default: "things to do")
+    
+    Returns:
+        Dictionary with "flights", "hotels", and "activities" result lists
+    """
+    check_out_date = _default_check_out_date(outbound_date, return_date)
+    
+    flights, hotels, activities = await _gather_or_empty(
+        "Trip bundle",
+        ("flights", search_flights(
+            origin, destination, outbound_date, return_date, include_return_flights
+        )),
+        ("hotels", search_hotels(destination, outbound_date, check_out_date)),
+        ("activities", search_activities(destination, activity_type)),
+    )
+    return {"flights": flights, "hotels": hotels, "activities": activities}
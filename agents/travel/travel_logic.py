@@ -15,7 +15,12 @@ Key functions:
 """
 
 import logging
-from datetime import datetime, timedelta
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
 from config.config import TRAVEL_HOTEL_CHECKIN_GAP_HOURS
@@ -27,6 +32,57 @@ logger = logging.getLogger("lungo.travel.travel_logic")
 MIN_OVERALL_RATING = 3.7  # Minimum overall hotel rating (1-5 scale)
 MIN_LOCATION_RATING = 4.0  # Minimum location rating (1-5 scale)
 
+# Canonical arrival time shapes ("2026-01-15 18:30", "2026-01-15T18:30",
+# "2026-01-15 18:30:00") in ASCII digits, parsed without strptime
+_ARRIVAL_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})[ T]([0-9]{2}):([0-9]{2})(?::([0-9]{2}))?")
+
+# Arrival time formats accepted by extract_arrival_datetime, tried in order
+# when the fast path does not match (e.g. unpadded fields)
+_ARRIVAL_TIME_FORMATS = (
+    "%Y-%m-%d %H:%M",     # Full datetime: "2026-01-15 18:30"
+    "%Y-%m-%dT%H:%M",     # ISO format: "2026-01-15T18:30"
+    "%Y-%m-%d %H:%M:%S",  # With seconds: "2026-01-15 18:30:00"
+)
+
+_DEFAULT_CHECKIN_TIME = time(15, 0)  # Hotels without a parseable check-in time
+_MIDNIGHT_TIME = time(23, 59)  # Latest reasonable time to reach the hotel
+
+# Airport-to-hotel gap for the configured default, built once at import
+_DEFAULT_GAP = timedelta(hours=TRAVEL_HOTEL_CHECKIN_GAP_HOURS)
+
+
+@dataclass(slots=True, frozen=True)
+class _Flight:
+    """
+    A flight option prepared for plan search.
+
+    Attributes:
+        price: Total price in USD
+        arrival: Parsed arrival datetime at the destination
+        source: The original flight dictionary
+    """
+    price: float
+    arrival: datetime
+    source: dict = field(repr=False, compare=False)
+
+
+@dataclass(slots=True, frozen=True)
+class _Hotel:
+    """
+    A hotel option prepared for plan search.
+
+    Attributes:
+        price: Price in USD
+        checkin_ord: Check-in date ordinal, or None if the hotel has no
+                     usable check-in date
+        checkin_minutes: Check-in minute of day
+        source: The original hotel dictionary
+    """
+    price: float
+    checkin_ord: Optional[int]
+    checkin_minutes: int
+    source: dict = field(repr=False, compare=False)
+
 
 def extract_arrival_datetime(flight: dict) -> Optional[datetime]:
     """
@@ -56,20 +112,41 @@ def extract_arrival_datetime(flight: dict) -> Optional[datetime]:
         logger.warning("No arrival time found in flight data")
         return None
     
-    # Try parsing various time formats
-    formats_to_try = [
-        "%Y-%m-%d %H:%M",     # Full datetime: "2026-01-15 18:30"
-        "%Y-%m-%dT%H:%M",     # ISO format: "2026-01-15T18:30"
-        "%Y-%m-%d %H:%M:%S",  # With seconds: "2026-01-15 18:30:00"
-    ]
+    arrival = _parse_arrival_time(arrival_time_str)
+    if arrival is None:
+        logger.warning("Could not parse arrival time: %s", arrival_time_str)
+    return arrival
+
+
+# Arrival and check-in strings repeat heavily (flights sharing a landing
+# time, hotels sharing the 15:00 default), so parsed values are memoized.
+# The results are immutable, so sharing them between callers is safe.
+@lru_cache(maxsize=4096)
+def _parse_arrival_time(arrival_time_str: str) -> Optional[datetime]:
+    """
+    Parse an arrival time string in one of the supported formats.
     
-    for fmt in formats_to_try:
+    Returns:
+        datetime object, or None if no supported format matches
+    """
+    # Fast path: zero-padded timestamps as returned by SerpAPI
+    match = _ARRIVAL_RE.fullmatch(arrival_time_str)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second or 0)
+            )
+        except ValueError:
+            pass
+    
+    # Try parsing various time formats
+    for fmt in _ARRIVAL_TIME_FORMATS:
         try:
             return datetime.strptime(arrival_time_str, fmt)
         except ValueError:
             continue
     
-    logger.warning(f"Could not parse arrival time: {arrival_time_str}")
     return None
 
 
@@ -115,80 +192,44 @@ def filter_valid_hotels(
         gap_hours = TRAVEL_HOTEL_CHECKIN_GAP_HOURS
     
     # Calculate when traveler actually arrives at hotel
-    traveler_hotel_arrival = flight_arrival + timedelta(hours=gap_hours)
+    traveler_hotel_arrival = flight_arrival + _gap_delta(gap_hours)
+    arrival_ord, arrival_minutes, before_midnight = _traveler_arrival_key(flight_arrival, gap_hours)
     
-    # Reasonable cutoff - traveler should arrive at hotel before midnight
-    midnight_cutoff = datetime.combine(flight_arrival.date(), datetime.strptime("23:59", "%H:%M").time())
-    
-    logger.info(
-        f"Filtering hotels: flight arrives {flight_arrival.strftime('%Y-%m-%d %H:%M')}, "
-        f"traveler reaches hotel by {traveler_hotel_arrival.strftime('%Y-%m-%d %H:%M')} (gap: {gap_hours}h)"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Filtering hotels: flight arrives %s, traveler reaches hotel by %s (gap: %sh)",
+            flight_arrival.strftime('%Y-%m-%d %H:%M'),
+            traveler_hotel_arrival.strftime('%Y-%m-%d %H:%M'),
+            gap_hours,
+        )
     
+    # The per-hotel messages need date conversions for their arguments, so
+    # skip building them entirely unless debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
     valid_hotels = []
     
     for hotel in hotels:
-        hotel_checkin_datetime = _get_hotel_checkin_datetime(hotel, flight_arrival)
+        checkin_ord, checkin_minutes = _get_hotel_checkin_key(hotel)
+        if checkin_ord is None:
+            # No usable check-in date - assume check-in on the flight arrival day
+            checkin_ord = flight_arrival.toordinal()
         
-        if hotel_checkin_datetime is None:
-            # If we can't determine check-in time, include it anyway (be permissive)
-            logger.warning(f"Could not determine check-in time for hotel: {hotel.get('name')}, including anyway")
+        if _is_checkin_valid(arrival_ord, arrival_minutes, before_midnight, checkin_ord, checkin_minutes):
             valid_hotels.append(hotel)
-            continue
-        
-        # Check-in timing rules:
-        # 1. If traveler arrives on SAME DAY as check-in date:
-        #    - Must arrive after check-in time (e.g., arrive 5 PM, check-in at 3 PM = OK)
-        # 2. If traveler arrives AFTER check-in date (next day or later):
-        #    - Can check in at any time (hotel holds the reservation)
-        #    - Common for overnight/redeye flights
-        # 3. Traveler should arrive within reasonable time (before 2 AM to avoid losing another night)
-        
-        arrival_date = traveler_hotel_arrival.date()
-        checkin_date = hotel_checkin_datetime.date()
-        
-        # Calculate reasonable late-night cutoff (2 AM next day is still considered same-day arrival)
-        late_night_cutoff = datetime.combine(
-            arrival_date + timedelta(days=1), 
-            datetime.strptime("02:00", "%H:%M").time()
-        )
-        
-        # Case 1: Traveler arrives on check-in date (same day)
-        same_day_arrival = arrival_date == checkin_date
-        
-        # Case 2: Traveler arrives after check-in date (next day - hotel holds reservation)
-        # This is common for overnight flights that depart day 1 and arrive day 2
-        next_day_arrival = arrival_date > checkin_date
-        
-        # For same-day arrival, check if check-in time has passed
-        if same_day_arrival:
-            # On check-in day: must arrive after check-in time (or wait until then)
-            checkin_time_passed = traveler_hotel_arrival.time() >= hotel_checkin_datetime.time()
-            is_valid = checkin_time_passed or traveler_hotel_arrival <= midnight_cutoff
-        elif next_day_arrival:
-            # After check-in date: hotel holds reservation, can check in anytime
-            # Just make sure it's not too many days late (within 1 day is reasonable)
-            days_late = (arrival_date - checkin_date).days
-            is_valid = days_late <= 1  # Allow up to 1 day late arrival
-        else:
-            # Arriving before check-in date - not valid
-            is_valid = False
-        
-        if is_valid:
-            valid_hotels.append(hotel)
-            logger.debug(
-                f"Hotel '{hotel.get('name')}' is valid "
-                f"(check-in: {checkin_date} {hotel_checkin_datetime.time()}, "
-                f"arrival: {arrival_date} {traveler_hotel_arrival.time()})"
-            )
-        else:
+            if debug:
+                logger.debug(
+                    "Hotel '%s' is valid (check-in: %s %02d:%02d, arrival: %s)",
+                    hotel.get('name'), date.fromordinal(checkin_ord),
+                    checkin_minutes // 60, checkin_minutes % 60, traveler_hotel_arrival,
+                )
+        elif debug:
             logger.debug(
-                f"Hotel '{hotel.get('name')}' excluded - "
-                f"check-in: {checkin_date} {hotel_checkin_datetime.time()}, "
-                f"arrival: {arrival_date} {traveler_hotel_arrival.time()}"
+                "Hotel '%s' excluded - check-in: %s %02d:%02d, arrival: %s",
+                hotel.get('name'), date.fromordinal(checkin_ord),
+                checkin_minutes // 60, checkin_minutes % 60, traveler_hotel_arrival,
             )
     
-    logger.info(f"Filtered {len(valid_hotels)} valid hotels from {len(hotels)} total")
+    logger.info("Filtered %s valid hotels from %s total", len(valid_hotels), len(hotels))
     return valid_hotels
 
 
@@ -216,15 +257,15 @@ def filter_hotels_by_rating(
         >>> quality_hotels = filter_hotels_by_rating(hotels, min_overall=3.7, min_location=4.0)
     """
     logger.info(
-        f"Filtering hotels by rating: min_overall={min_overall_rating}, "
-        f"min_location={min_location_rating}"
+        "Filtering hotels by rating: min_overall=%s, min_location=%s",
+        min_overall_rating, min_location_rating,
     )
     
     valid_hotels = []
     
     for hotel in hotels:
         # Get overall rating - check multiple possible field names
-        overall_rating = hotel.get("overall_rating", 0) or hotel.get("rating", 0) or 0
+        overall_rating = _effective_rating(hotel)
         location_rating = hotel.get("location_rating", 0) or 0
         
         # Check overall rating threshold - REQUIRED
@@ -244,62 +285,336 @@ def filter_hotels_by_rating(
         if meets_overall and meets_location:
             valid_hotels.append(hotel)
             logger.debug(
-                f"Hotel '{hotel.get('name')}' meets rating criteria "
-                f"(overall: {overall_rating}, location: {location_rating if location_rating > 0 else 'N/A'})"
+                "Hotel '%s' meets rating criteria (overall: %s, location: %s)",
+                hotel.get('name'), overall_rating, location_rating if location_rating > 0 else 'N/A',
             )
         else:
             logger.debug(
-                f"Hotel '{hotel.get('name')}' excluded - "
-                f"overall: {overall_rating} (min: {min_overall_rating}), "
-                f"location: {location_rating if location_rating > 0 else 'N/A'} (min: {min_location_rating})"
+                "Hotel '%s' excluded - overall: %s (min: %s), location: %s (min: %s)",
+                hotel.get('name'), overall_rating, min_overall_rating,
+                location_rating if location_rating > 0 else 'N/A', min_location_rating,
             )
     
-    logger.info(f"Filtered {len(valid_hotels)} quality hotels from {len(hotels)} total")
+    logger.info("Filtered %s quality hotels from %s total", len(valid_hotels), len(hotels))
     return valid_hotels
 
 
-def _get_hotel_checkin_datetime(hotel: dict, reference_date: datetime) -> Optional[datetime]:
+def _effective_rating(hotel: dict) -> float:
+    """Overall rating of a hotel, falling back to "rating", then 0."""
+    return hotel.get("overall_rating") or hotel.get("rating") or 0
+
+
+def _rating_tiers(
+    hotels: list[dict],
+    min_overall_rating: float,
+    min_location_rating: float,
+) -> tuple[list[dict], list[dict], list[dict]]:
     """
-    Convert hotel check-in date and time into a datetime object.
-    
-    If check_in_date is provided, use it. Otherwise, use the reference_date
-    (typically the flight arrival date) as the check-in date.
+    Split hotels into the rating tiers find_cheapest_plan falls back through.
     
-    Default check-in time is 15:00 (3 PM) if not specified.
+    One pass replaces re-filtering the full list for each relaxed tier.
+    Tiers keep the input order and use the same rules as
+    filter_hotels_by_rating.
     
     Args:
-        hotel: Hotel dictionary with check_in_date and check_in_time
-        reference_date: Date to use if hotel check_in_date is not available
+        hotels: List of hotel dictionaries with rating info
+        min_overall_rating: Minimum overall rating required
+        min_location_rating: Minimum location rating required (when known)
     
     Returns:
-        datetime for hotel check-in, or None if parsing fails
+        Tuple of (hotels meeting both thresholds, hotels meeting the overall
+        threshold, hotels rated 3.0 or better)
+    """
+    quality_hotels = []
+    overall_only_hotels = []
+    rated_hotels = []
+    
+    for hotel in hotels:
+        overall_rating = _effective_rating(hotel)
+        if overall_rating >= 3.0:
+            rated_hotels.append(hotel)
+        if overall_rating >= min_overall_rating:
+            overall_only_hotels.append(hotel)
+            # A missing location rating does not count against the hotel
+            location_rating = hotel.get("location_rating", 0) or 0
+            if location_rating <= 0 or location_rating >= min_location_rating:
+                quality_hotels.append(hotel)
+    
+    logger.info(
+        "Rated %s hotels: %s meet overall>=%s and location>=%s, %s meet overall only",
+        len(hotels), len(quality_hotels), min_overall_rating, min_location_rating,
+        len(overall_only_hotels),
+    )
+    return quality_hotels, overall_only_hotels, rated_hotels
+
+
+@lru_cache(maxsize=4096)
+def _parse_checkin_date(check_in_date_str: str) -> Optional[date]:
     """
-    # Get check-in date - use hotel's date or flight arrival date
-    check_in_date_str = hotel.get("check_in_date", "")
+    Parse a hotel check-in date string ("YYYY-MM-DD").
     
-    if check_in_date_str:
+    Returns:
+        date object, or None if the string is empty or malformed
+    """
+    if not check_in_date_str:
+        return None
+    # fromisoformat is much cheaper than strptime; only use it on the exact
+    # "YYYY-MM-DD" shape, since it also accepts forms strptime rejects
+    if len(check_in_date_str) == 10 and check_in_date_str[4] == check_in_date_str[7] == "-":
         try:
-            check_in_date = datetime.strptime(check_in_date_str, "%Y-%m-%d").date()
+            return date.fromisoformat(check_in_date_str)
         except ValueError:
-            check_in_date = reference_date.date()
-    else:
-        check_in_date = reference_date.date()
-    
-    # Get check-in time - default to 15:00 (3 PM) if not specified
-    check_in_time_str = hotel.get("check_in_time", "15:00")
+            pass
+    try:
+        return datetime.strptime(check_in_date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_checkin_time(check_in_time_str: str) -> time:
+    """
+    Parse a hotel check-in time string (e.g., "15:00" or "3:00 PM").
     
+    Returns:
+        time object, defaulting to 15:00 (3 PM) if parsing fails
+    """
     try:
-        # Parse time string (e.g., "15:00" or "3:00 PM")
         if "PM" in check_in_time_str.upper() or "AM" in check_in_time_str.upper():
-            check_in_time = datetime.strptime(check_in_time_str, "%I:%M %p").time()
-        else:
-            check_in_time = datetime.strptime(check_in_time_str, "%H:%M").time()
+            return datetime.strptime(check_in_time_str, "%I:%M %p").time()
+        if len(check_in_time_str) == 5 and check_in_time_str[2] == ":":
+            try:
+                return time.fromisoformat(check_in_time_str)
+            except ValueError:
+                pass
+        return datetime.strptime(check_in_time_str, "%H:%M").time()
     except ValueError:
         # Default to 3 PM if parsing fails
-        check_in_time = datetime.strptime("15:00", "%H:%M").time()
+        return _DEFAULT_CHECKIN_TIME
+
+
+def _get_hotel_checkin_key(hotel: dict) -> tuple[Optional[int], int]:
+    """
+    Normalize a hotel's check-in into integers for cheap comparisons.
+    
+    Args:
+        hotel: Hotel dictionary with check_in_date and check_in_time
     
-    # Combine date and time
-    return datetime.combine(check_in_date, check_in_time)
+    Returns:
+        Tuple of (check-in date ordinal, check-in minute of day). The ordinal
+        is None when the hotel has no usable check-in date; callers substitute
+        the flight arrival day in that case.
+    """
+    check_in_date = _parse_checkin_date(hotel.get("check_in_date", ""))
+    check_in_time = _parse_checkin_time(hotel.get("check_in_time", "15:00"))
+    checkin_ord = check_in_date.toordinal() if check_in_date else None
+    return checkin_ord, check_in_time.hour * 60 + check_in_time.minute
+
+
+def _gap_delta(gap_hours: int) -> timedelta:
+    """Convert the arrival-to-hotel gap to a timedelta, reusing the default."""
+    if gap_hours == TRAVEL_HOTEL_CHECKIN_GAP_HOURS:
+        return _DEFAULT_GAP
+    return timedelta(hours=gap_hours)
+
+
+def _traveler_arrival_key(flight_arrival: datetime, gap_hours: int) -> tuple[int, int, bool]:
+    """
+    Normalize when the traveler reaches the hotel into integers.
+    
+    Args:
+        flight_arrival: datetime when flight arrives at destination
+        gap_hours: Hours between flight arrival and reaching the hotel
+    
+    Returns:
+        Tuple of (arrival date ordinal, arrival minute of day, whether the
+        traveler reaches the hotel before midnight of the flight arrival day)
+    """
+    traveler_hotel_arrival = flight_arrival + _gap_delta(gap_hours)
+    
+    # Reasonable cutoff - traveler should arrive at hotel before midnight
+    midnight_cutoff = datetime.combine(flight_arrival.date(), _MIDNIGHT_TIME)
+    
+    return (
+        traveler_hotel_arrival.toordinal(),
+        traveler_hotel_arrival.hour * 60 + traveler_hotel_arrival.minute,
+        traveler_hotel_arrival <= midnight_cutoff,
+    )
+
+
+def _is_checkin_valid(
+    arrival_ord: int,
+    arrival_minutes: int,
+    before_midnight: bool,
+    checkin_ord: int,
+    checkin_minutes: int,
+) -> bool:
+    """
+    Apply the check-in timing rules to pre-normalized integer values.
+    
+    Check-in timing rules:
+    1. If traveler arrives on SAME DAY as check-in date:
+       - Must arrive after check-in time (e.g., arrive 5 PM, check-in at 3 PM = OK),
+         or still reach the hotel before midnight (they can wait until check-in opens)
+    2. If traveler arrives AFTER check-in date (next day):
+       - Can check in at any time (hotel holds the reservation)
+       - Common for overnight/redeye flights
+    3. Arriving before the check-in date, or more than 1 day late, is not valid
+    
+    Args:
+        arrival_ord: Date ordinal when the traveler reaches the hotel
+        arrival_minutes: Minute of day when the traveler reaches the hotel
+        before_midnight: Whether the traveler reaches the hotel before midnight
+                         of the flight arrival day
+        checkin_ord: Hotel check-in date ordinal
+        checkin_minutes: Hotel check-in minute of day
+    
+    Returns:
+        True if the hotel can be checked into on arrival
+    """
+    days_late = arrival_ord - checkin_ord
+    if days_late == 0:
+        return arrival_minutes >= checkin_minutes or before_midnight
+    # Allow up to 1 day late arrival
+    return days_late == 1
+
+
+def _to_flight(flight: dict) -> Optional[_Flight]:
+    """
+    Convert a flight dictionary into a flight record for plan search.
+    
+    Args:
+        flight: Flight dictionary from search_flights()
+    
+    Returns:
+        Flight record, or None if the arrival time cannot be parsed
+    """
+    arrival = extract_arrival_datetime(flight)
+    if arrival is None:
+        return None
+    
+    return _Flight(
+        price=flight.get("price") or 0,
+        arrival=arrival,
+        source=flight,
+    )
+
+
+def _to_hotel(hotel: dict) -> _Hotel:
+    """
+    Convert a hotel dictionary into a hotel record for plan search.
+    
+    Args:
+        hotel: Hotel dictionary from search_hotels()
+    
+    Returns:
+        Hotel record with normalized check-in timing
+    """
+    checkin_ord, checkin_minutes = _get_hotel_checkin_key(hotel)
+    
+    return _Hotel(
+        price=hotel.get("price") or 0,
+        checkin_ord=checkin_ord,
+        checkin_minutes=checkin_minutes,
+        source=hotel,
+    )
+
+
+def _build_checkin_index(hotels: list[_Hotel]) -> dict:
+    """
+    Group hotels by check-in day for sub-linear cheapest-hotel lookups.
+    
+    Each group maps a check-in date ordinal (None for hotels without a usable
+    check-in date) to two parallel lists sorted by check-in minute of day:
+    - minutes: check-in minute of day of each hotel
+    - prefix_min: prefix_min[i] is the cheapest (price, hotel index) among
+      minutes[0..i]; ties resolve to the hotel listed first
+    
+    Invariant: the cheapest hotel whose check-in opens at or before minute m
+    is prefix_min[bisect_right(minutes, m) - 1].
+    
+    Args:
+        hotels: List of hotel records
+    
+    Returns:
+        Dictionary of check-in ordinal -> (minutes, prefix_min)
+    """
+    groups: dict[Optional[int], list[tuple[int, float, int]]] = {}
+    for hotel_index, hotel in enumerate(hotels):
+        groups.setdefault(hotel.checkin_ord, []).append(
+            (hotel.checkin_minutes, hotel.price, hotel_index)
+        )
+    
+    checkin_index = {}
+    for checkin_ord, entries in groups.items():
+        entries.sort(key=itemgetter(0))
+        minutes = []
+        prefix_min = []
+        cheapest = None
+        for checkin_minutes, price, hotel_index in entries:
+            if cheapest is None or (price, hotel_index) < cheapest:
+                cheapest = (price, hotel_index)
+            minutes.append(checkin_minutes)
+            prefix_min.append(cheapest)
+        checkin_index[checkin_ord] = (minutes, prefix_min)
+    
+    return checkin_index
+
+
+def _cheapest_valid_hotel(
+    checkin_index: dict,
+    arrival_ord: int,
+    arrival_minutes: int,
+    before_midnight: bool,
+    flight_arrival_ord: int,
+) -> Optional[tuple[float, int]]:
+    """
+    Look up the cheapest hotel that passes the check-in timing rules.
+    
+    Applies the same rules as _is_checkin_valid, but per check-in day group:
+    hotels checking in the day before arrival are all valid, hotels checking in
+    on the arrival day are valid if the traveler arrives before midnight or
+    after check-in opens. Hotels without a check-in date use the flight
+    arrival day.
+    
+    Args:
+        checkin_index: Index built by _build_checkin_index
+        arrival_ord: Date ordinal when the traveler reaches the hotel
+        arrival_minutes: Minute of day when the traveler reaches the hotel
+        before_midnight: Whether the traveler reaches the hotel before midnight
+                         of the flight arrival day
+        flight_arrival_ord: Date ordinal of the flight arrival
+    
+    Returns:
+        Tuple of (hotel price, hotel index), or None if no hotel is valid
+    """
+    cheapest = None
+    
+    for group_key, checkin_ord in (
+        (arrival_ord - 1, arrival_ord - 1),
+        (arrival_ord, arrival_ord),
+        (None, flight_arrival_ord),
+    ):
+        group = checkin_index.get(group_key)
+        if group is None:
+            continue
+        minutes, prefix_min = group
+        
+        days_late = arrival_ord - checkin_ord
+        if days_late == 1 or (days_late == 0 and before_midnight):
+            candidate = prefix_min[-1]
+        elif days_late == 0:
+            position = bisect_right(minutes, arrival_minutes)
+            if not position:
+                continue
+            candidate = prefix_min[position - 1]
+        else:
+            continue
+        
+        if cheapest is None or candidate < cheapest:
+            cheapest = candidate
+    
+    return cheapest
 
 
 def find_cheapest_plan(
@@ -312,17 +627,23 @@ def find_cheapest_plan(
     """
     Find the cheapest flight + hotel combination that meets timing and rating constraints.
     
-    This function iterates through all flight options, filters hotels that are
+    This function iterates through all flight options, finds hotels that are
     valid for each flight's arrival time AND meet rating thresholds, then finds 
     the combination with the lowest total price (flight + hotel).
     
     Algorithm:
-    1. Filter hotels by minimum overall rating (>=3.7) and location rating (>=4.0)
+    1. Filter hotels by minimum overall rating (>=3.7) and location rating (>=4.0),
+       then index them by check-in day with a running minimum price per
+       check-in time
     2. For each flight, extract arrival datetime
-    3. Filter remaining hotels that allow check-in after arrival + gap_hours
-    4. Find cheapest valid hotel for that flight
-    5. Track minimum total cost across all combinations
-    6. Return the best plan
+    3. Binary-search the index for hotels that allow check-in after
+       arrival + gap_hours and read off the cheapest one
+    4. Track minimum total cost, visiting flights cheapest first and
+       stopping once a flight plus the cheapest hotel cannot beat it
+    5. Return the best plan
+    
+    This runs in O(H log H + F log F + F log H) rather than checking every
+    flight x hotel pair.
     
     Args:
         flights: List of flight options from search_flights()
@@ -354,7 +675,7 @@ def find_cheapest_plan(
     if gap_hours is None:
         gap_hours = TRAVEL_HOTEL_CHECKIN_GAP_HOURS
     
-    logger.info(f"Finding cheapest plan from {len(flights)} flights and {len(hotels)} hotels")
+    logger.info("Finding cheapest plan from %s flights and %s hotels", len(flights), len(hotels))
     
     if not flights:
         logger.warning("No flights provided")
@@ -366,77 +687,103 @@ def find_cheapest_plan(
     
     # STEP 1: Filter hotels by rating requirements first
     # This ensures we only consider quality accommodations
-    quality_hotels = filter_hotels_by_rating(
-        hotels, 
-        min_overall_rating=min_overall_rating,
-        min_location_rating=min_location_rating
+    quality_hotels, overall_only_hotels, rated_hotels = _rating_tiers(
+        hotels, min_overall_rating, min_location_rating
     )
     
     if not quality_hotels:
         logger.warning(
-            f"No hotels meet rating criteria (overall>={min_overall_rating}, "
-            f"location>={min_location_rating}). Relaxing criteria..."
+            "No hotels meet rating criteria (overall>=%s, location>=%s). Relaxing criteria...",
+            min_overall_rating, min_location_rating,
         )
         # Fallback: If no hotels meet strict criteria, try with just overall rating
-        quality_hotels = filter_hotels_by_rating(
-            hotels, 
-            min_overall_rating=min_overall_rating,
-            min_location_rating=0  # Remove location rating requirement
-        )
+        quality_hotels = overall_only_hotels
         
         if not quality_hotels:
             # Further fallback: use all hotels with any rating >= 3.0
             logger.warning("Still no hotels after relaxing criteria. Using all rated hotels.")
-            quality_hotels = [h for h in hotels if (h.get("overall_rating", 0) or h.get("rating", 0) or 0) >= 3.0]
+            quality_hotels = rated_hotels
             
             if not quality_hotels:
                 quality_hotels = hotels  # Last resort: use all hotels
     
+    # Convert hotels to compact records and index them by check-in day once,
+    # instead of re-checking every hotel for every flight
+    hotel_records = [_to_hotel(hotel) for hotel in quality_hotels]
+    checkin_index = _build_checkin_index(hotel_records)
+    
+    cheapest_hotel_price = min(hotel.price for hotel in hotel_records)
+    
     best_plan = None
     best_total_price = float('inf')
+    best_position = len(flights)
     
-    for flight in flights:
+    # Fares on the same flight (or flights landing together) share an arrival
+    # time, and the cheapest valid hotel depends only on that arrival
+    cheapest_by_arrival: dict[datetime, Optional[tuple[float, int]]] = {}
+    
+    # Visit flights cheapest first: once a flight plus the cheapest hotel
+    # costs more than the best plan, no later flight can beat it. Ties on
+    # total price still go to the flight listed first.
+    by_price = sorted(
+        range(len(flights)), key=lambda position: flights[position].get("price") or 0
+    )
+    
+    for position in by_price:
+        flight_data = flights[position]
+        if (flight_data.get("price") or 0) + cheapest_hotel_price > best_total_price:
+            break
+        
         # STEP 2: Get when traveler arrives at destination
-        arrival_datetime = extract_arrival_datetime(flight)
+        flight = _to_flight(flight_data)
         
-        if arrival_datetime is None:
-            logger.warning(f"Skipping flight with unparseable arrival time")
+        if flight is None:
+            logger.warning("Skipping flight with unparseable arrival time")
             continue
         
-        # STEP 3: Filter remaining hotels by timing constraints
-        valid_hotels = filter_valid_hotels(quality_hotels, arrival_datetime, gap_hours)
+        # STEPS 3-4: Find the cheapest hotel meeting the timing constraints
+        if flight.arrival in cheapest_by_arrival:
+            cheapest = cheapest_by_arrival[flight.arrival]
+        else:
+            cheapest = cheapest_by_arrival[flight.arrival] = _cheapest_valid_hotel(
+                checkin_index,
+                *_traveler_arrival_key(flight.arrival, gap_hours),
+                flight_arrival_ord=flight.arrival.toordinal(),
+            )
         
-        if not valid_hotels:
-            logger.debug(f"No valid hotels for flight arriving at {arrival_datetime}")
+        if cheapest is None:
+            logger.debug("No valid hotels for flight arriving at %s", flight.arrival)
             continue
         
-        # STEP 4: Find cheapest valid hotel for this flight
-        for hotel in valid_hotels:
-            flight_price = flight.get("price") or 0
-            hotel_price = hotel.get("price") or 0
-            total_price = flight_price + hotel_price
-            
-            if total_price < best_total_price:
-                best_total_price = total_price
-                best_plan = {
-                    "flight": flight,
-                    "hotel": hotel,
-                    "total_price": total_price,
-                    "gap_hours": gap_hours,
-                    "arrival_time": arrival_datetime.strftime("%Y-%m-%d %H:%M"),
-                }
-                logger.debug(
-                    f"New best plan: ${total_price} (flight: ${flight_price}, "
-                    f"hotel: ${hotel_price}, rating: {hotel.get('overall_rating', 'N/A')})"
-                )
+        hotel_price, hotel_index = cheapest
+        hotel = hotel_records[hotel_index]
+        total_price = flight.price + hotel_price
+        
+        if total_price < best_total_price or (
+            total_price == best_total_price and position < best_position
+        ):
+            best_total_price = total_price
+            best_position = position
+            best_plan = {
+                "flight": flight.source,
+                "hotel": hotel.source,
+                "total_price": total_price,
+                "gap_hours": gap_hours,
+                "arrival_time": flight.arrival.strftime("%Y-%m-%d %H:%M"),
+            }
+            logger.debug(
+                "New best plan: $%s (flight: $%s, hotel: $%s, rating: %s)",
+                total_price, flight.price, hotel_price,
+                hotel.source.get('overall_rating', 'N/A'),
+            )
     
     if best_plan:
         hotel = best_plan['hotel']
         logger.info(
-            f"Found cheapest plan: ${best_plan['total_price']} total "
-            f"(flight: ${best_plan['flight']['price']}, hotel: ${hotel['price']}, "
-            f"overall_rating: {hotel.get('overall_rating', 'N/A')}, "
-            f"location_rating: {hotel.get('location_rating', 'N/A')})"
+            "Found cheapest plan: $%s total (flight: $%s, hotel: $%s, "
+            "overall_rating: %s, location_rating: %s)",
+            best_plan['total_price'], best_plan['flight']['price'], hotel['price'],
+            hotel.get('overall_rating', 'N/A'), hotel.get('location_rating', 'N/A'),
         )
     else:
         logger.warning("No valid flight + hotel combination found")
@@ -0,0 +1,34 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Event loop selection for agent server entry points.
+
+The search agents spend nearly all of their time waiting on SerpAPI and the
+message transport, so they run on uvloop (libuv) when it is installed. uvloop
+does not support Windows; there the standard asyncio loop is used.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on uvloop if available, else asyncio.
+
+    Args:
+        main: Top-level coroutine of the server
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -47,6 +47,18 @@ OAUTH2_APPKEY = os.getenv("OAUTH2_APPKEY", "")
 SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY", "")
 SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL", "https://serpapi.com/search")
 
+# Use HTTP/2 for SerpAPI requests so concurrent searches share one connection
+# Set to "false" to fall back to HTTP/1.1 connection pooling
+SERPAPI_HTTP2_ENABLED = os.getenv("SERPAPI_HTTP2_ENABLED", "true").lower() in ("true", "1", "yes")
+
+# Maximum SerpAPI requests in flight per process; extra requests wait their turn
+# With HTTP/2 these share a single multiplexed connection
+SERPAPI_MAX_CONCURRENT_REQUESTS = int(os.getenv("SERPAPI_MAX_CONCURRENT_REQUESTS", "8"))
+
+# Optional Redis URL for sharing cached SerpAPI results across processes and
+# replicas (e.g. "redis://redis:6379/0"). Empty keeps the cache in-process only
+SERPAPI_CACHE_REDIS_URL = os.getenv("SERPAPI_CACHE_REDIS_URL", "")
+
 # Minimum hours required between flight arrival and hotel check-in
 # This buffer accounts for: deplaning, customs, baggage, airport-to-hotel travel
 # Default: 2 hours - adjust based on your use case
@@ -0,0 +1,183 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+QueryCache expiry, eviction and shared-store behavior, plus the cache
+controls on the SerpAPI search functions. Time is driven by a fake clock.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from agents.travel import cache, serpapi_tools
+from agents.travel.cache import QueryCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    fake_time = SimpleNamespace(monotonic=lambda: now.value, time=lambda: now.value)
+    monkeypatch.setattr(cache, "time", fake_time)
+    return now
+
+
+class MemoryStore:
+    """Stand-in shared store keeping [expires_at, value] pairs like Redis."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl):
+        self.entries[key] = (cache.time.time() + ttl, list(value))
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_entries_expire_after_ttl(clock):
+    query_cache = QueryCache(ttl=60)
+    run(query_cache.set("key", [1]))
+
+    clock.value += 59
+    assert run(query_cache.get("key")) == [1]
+    clock.value += 1
+    assert run(query_cache.get("key")) is None
+    assert len(query_cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    query_cache = QueryCache(ttl=60, max_size=2)
+    run(query_cache.set("a", [1]))
+    run(query_cache.set("b", [2]))
+    run(query_cache.get("a"))  # "b" is now least recently used
+    run(query_cache.set("c", [3]))
+
+    assert len(query_cache) == 2
+    assert run(query_cache.get("b")) is None
+    assert run(query_cache.get("a")) == [1]
+    assert run(query_cache.get("c")) == [3]
+
+
+def test_results_are_copied_in_and_out(clock):
+    query_cache = QueryCache(ttl=60)
+    value = [1]
+    run(query_cache.set("key", value))
+    value.append(2)
+    run(query_cache.get("key")).append(3)
+
+    assert run(query_cache.get("key")) == [1]
+
+
+def test_local_miss_reads_shared_store_with_remaining_ttl(clock):
+    store = MemoryStore()
+    run(QueryCache(ttl=60, store=store).set("key", [1]))
+
+    # A fresh process sees the entry with its remaining lifetime
+    clock.value += 50
+    query_cache = QueryCache(ttl=60, store=store)
+    assert run(query_cache.get("key")) == [1]
+    assert len(query_cache) == 1
+
+    store.entries.clear()
+    clock.value += 9
+    assert run(query_cache.get("key")) == [1]
+    clock.value += 1
+    assert run(query_cache.get("key")) is None
+
+
+def test_expired_shared_entry_is_a_miss(clock):
+    store = MemoryStore()
+    store.entries["key"] = (clock.value - 1, [1])
+    query_cache = QueryCache(ttl=60, store=store)
+
+    assert run(query_cache.get("key")) is None
+    assert len(query_cache) == 0
+
+
+class FailingRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        raise ConnectionError("redis is down")
+
+    async def set(self, key, value, px):
+        self.calls += 1
+        raise ConnectionError("redis is down")
+
+
+def test_store_errors_fall_back_to_local_cache(clock):
+    pytest.importorskip("redis")
+    store = cache.RedisCacheStore("redis://localhost:6379/0")
+    client = store._client = FailingRedis()
+    query_cache = QueryCache(ttl=60, store=store)
+
+    run(query_cache.set("key", [1]))
+    assert run(query_cache.get("key")) == [1]
+    assert run(query_cache.get("other")) is None
+    # The failed write takes the store out of use until retry_after passes
+    assert client.calls == 1
+
+    clock.value += store.retry_after
+    assert run(query_cache.get("other")) is None
+    assert client.calls == 2
+
+
+def serve_activities(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"local_results": [{"title": f"Museum {len(calls)}"}]})
+
+    monkeypatch.setattr(serpapi_tools, "SERPAPI_API_KEY", "test-key")
+    monkeypatch.setattr(
+        serpapi_tools, "_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    serpapi_tools.invalidate_cache()
+    return calls
+
+
+def titles(activities):
+    return [activity["name"] for activity in activities]
+
+
+def test_search_is_served_from_cache(monkeypatch):
+    calls = serve_activities(monkeypatch)
+
+    first = run(serpapi_tools.search_activities("Tokyo"))
+    # Query normalization makes this the same cache entry
+    second = run(serpapi_tools.search_activities("  tokyo "))
+
+    assert titles(first) == titles(second) == ["Museum 1"]
+    assert len(calls) == 1
+
+
+def test_force_refresh_bypasses_cache(monkeypatch):
+    calls = serve_activities(monkeypatch)
+
+    run(serpapi_tools.search_activities("Tokyo"))
+    refreshed = run(serpapi_tools.search_activities("Tokyo", force_refresh=True))
+
+    assert titles(refreshed) == ["Museum 2"]
+    assert len(calls) == 2
+    # The refreshed result replaces the cached one
+    assert titles(run(serpapi_tools.search_activities("Tokyo"))) == ["Museum 2"]
+
+
+def test_invalidate_cache_drops_results(monkeypatch):
+    calls = serve_activities(monkeypatch)
+
+    run(serpapi_tools.search_activities("Tokyo"))
+    serpapi_tools.invalidate_cache()
+    run(serpapi_tools.search_activities("Tokyo"))
+
+    assert len(calls) == 2
@@ -0,0 +1,112 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Retry policy for SerpAPI requests, driven through _fetch_serpapi_results with
+a mock transport. Backoff sleeps are recorded instead of awaited.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from agents.travel import serpapi_tools
+
+OK_BODY = {"local_results": [{"title": "Museum"}]}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(serpapi_tools.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(serpapi_tools.random, "random", lambda: 0.5)
+    return delays
+
+
+def serve(monkeypatch, responses):
+    """Answer successive requests from responses (a Response or an exception)."""
+    calls = []
+
+    def handler(request):
+        outcome = responses[min(len(calls), len(responses) - 1)]
+        calls.append(request)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(serpapi_tools, "_CLIENT", client)
+    return calls
+
+
+def fetch():
+    return asyncio.run(
+        serpapi_tools._fetch_serpapi_results({}, ("local_results",), lambda entry: entry)
+    )
+
+
+def test_429_without_retry_after_backs_off(monkeypatch, sleeps):
+    calls = serve(monkeypatch, [httpx.Response(429), httpx.Response(200, json=OK_BODY)])
+
+    assert fetch() == OK_BODY["local_results"]
+    assert len(calls) == 2
+    assert sleeps == [1.5]  # base delay + jitter
+
+
+def test_429_honors_retry_after(monkeypatch, sleeps):
+    calls = serve(monkeypatch, [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(429, headers={"Retry-After": "600"}),
+        httpx.Response(200, json=OK_BODY),
+    ])
+
+    assert fetch() == OK_BODY["local_results"]
+    assert len(calls) == 3
+    assert sleeps == [7.0, serpapi_tools._RETRY_MAX_DELAY]
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_gateway_errors_retried_up_to_limit(monkeypatch, sleeps, status):
+    calls = serve(monkeypatch, [httpx.Response(status)])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch()
+    assert len(calls) == serpapi_tools._RETRY_ATTEMPTS
+    assert sleeps == [1.5, 2.5]
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 500])
+def test_client_errors_and_500_not_retried(monkeypatch, sleeps, status):
+    calls = serve(monkeypatch, [httpx.Response(status), httpx.Response(200, json=OK_BODY)])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_transport_errors_retried(monkeypatch, sleeps):
+    calls = serve(monkeypatch, [
+        httpx.ConnectError("connection refused"),
+        httpx.ReadTimeout("timed out"),
+        httpx.Response(200, json=OK_BODY),
+    ])
+
+    assert fetch() == OK_BODY["local_results"]
+    assert len(calls) == 3
+    assert sleeps == [1.5, 2.5]
+
+
+def test_backoff_is_bounded(monkeypatch):
+    monkeypatch.setattr(serpapi_tools.random, "random", lambda: 0.999)
+    error = httpx.ConnectError("connection refused")
+
+    delays = [serpapi_tools._retry_delay(error, attempt) for attempt in range(12)]
+
+    assert delays == sorted(delays)
+    assert max(delays) == serpapi_tools._RETRY_MAX_DELAY
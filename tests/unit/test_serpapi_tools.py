@@ -0,0 +1,223 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Return-flight matching is checked against the original linear scan.
+
+_fetch_serpapi_results is exercised against a mock transport that sends the
+body in small chunks without a Content-Length, which forces the ijson
+streaming path. Chunk boundaries deliberately fall inside keys and values.
+"""
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+
+from agents.travel import serpapi_tools
+
+
+def chunked(body: bytes, size: int):
+    async def stream():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    return stream()
+
+
+def use_transport(monkeypatch, handler):
+    """Route the shared SerpAPI client through a mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(serpapi_tools, "_CLIENT", client)
+    return client
+
+
+def fetch(params, results_keys, parse=lambda entry: entry):
+    return asyncio.run(serpapi_tools._fetch_serpapi_results(params, results_keys, parse))
+
+
+RESPONSE = {
+    "search_metadata": {"status": "Success"},
+    # Keys appear in the opposite order to results_keys
+    "other_flights": [
+        {"price": 300, "flights": [{"airline": "B", "legs": [1, 2]}]},
+        {"price": 400, "flights": []},
+    ],
+    "best_flights": [
+        {"price": 100, "flights": [{"airline": "A", "extra": {"nested": [True, None]}}]},
+    ],
+    "price_insights": {"lowest_price": 100},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_streamed_multi_chunk_response(monkeypatch, chunk_size):
+    body = json.dumps(RESPONSE).encode()
+    use_transport(monkeypatch, lambda request: httpx.Response(200, content=chunked(body, chunk_size)))
+
+    results = fetch({"engine": "google_flights"}, ("best_flights", "other_flights"))
+
+    assert results == RESPONSE["best_flights"] + RESPONSE["other_flights"]
+
+
+def test_streamed_results_match_buffered_decode(monkeypatch):
+    body = json.dumps(RESPONSE).encode()
+    keys = ("best_flights", "other_flights")
+    parse = lambda entry: {"price": entry["price"]} if entry["flights"] else None
+
+    use_transport(monkeypatch, lambda request: httpx.Response(200, content=chunked(body, 5)))
+    streamed = fetch({}, keys, parse)
+
+    # A short body with a Content-Length is decoded in one go
+    use_transport(monkeypatch, lambda request: httpx.Response(200, content=body))
+    buffered = fetch({}, keys, parse)
+
+    assert streamed == buffered == [{"price": 100}, {"price": 300}]
+
+
+def test_streamed_error_response(monkeypatch):
+    body = json.dumps({
+        "search_metadata": {"status": "Error"},
+        "error": "Invalid API key. Your API key should be here: https://serpapi.com/manage-api-key",
+        "properties": [{"name": "never parsed"}],
+    }).encode()
+    parsed = []
+    use_transport(monkeypatch, lambda request: httpx.Response(200, content=chunked(body, 3)))
+
+    with pytest.raises(serpapi_tools.SerpAPIError) as excinfo:
+        fetch({}, ("properties",), lambda entry: parsed.append(entry) or entry)
+
+    assert str(excinfo.value) == (
+        "SerpAPI error: Invalid API key. Your API key should be here: "
+        "https://serpapi.com/manage-api-key"
+    )
+    assert parsed == []
+
+
+def test_buffered_error_response(monkeypatch):
+    body = json.dumps({"error": "Google Hotels hasn't returned any results for this query."})
+    use_transport(monkeypatch, lambda request: httpx.Response(200, content=body.encode()))
+
+    with pytest.raises(serpapi_tools.SerpAPIError, match="hasn't returned any results"):
+        fetch({}, ("properties",))
+
+
+def test_error_status_reports_serpapi_message_without_api_key(monkeypatch):
+    monkeypatch.setattr(serpapi_tools, "SERPAPI_API_KEY", "secret-key")
+    serpapi_tools.invalidate_cache()
+    use_transport(
+        monkeypatch,
+        lambda request: httpx.Response(401, json={"error": "Invalid API key."}),
+    )
+
+    with pytest.raises(serpapi_tools.SerpAPIError) as excinfo:
+        asyncio.run(serpapi_tools.search_activities("Tokyo"))
+
+    assert str(excinfo.value) == "Failed to search activities: HTTP 401: Invalid API key."
+    assert "secret-key" not in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, httpx.HTTPStatusError)
+
+
+def test_trip_bundle_maps_a_failed_search_to_empty(monkeypatch):
+    calls = {}
+
+    async def search_flights(*args):
+        raise serpapi_tools.SerpAPIError("Failed to search flights: HTTP 503")
+
+    async def search_hotels(location, check_in_date, check_out_date):
+        calls["hotels"] = (location, check_in_date, check_out_date)
+        return [{"name": "Hotel"}]
+
+    async def search_activities(location, activity_type):
+        calls["activities"] = (location, activity_type)
+        return [{"name": "Museum"}]
+
+    monkeypatch.setattr(serpapi_tools, "search_flights", search_flights)
+    monkeypatch.setattr(serpapi_tools, "search_hotels", search_hotels)
+    monkeypatch.setattr(serpapi_tools, "search_activities", search_activities)
+
+    # One-way: hotels default to a single night
+    bundle = asyncio.run(serpapi_tools.search_trip_bundle("LAX", "Tokyo", "2026-01-15"))
+
+    assert bundle == {
+        "flights": [],
+        "hotels": [{"name": "Hotel"}],
+        "activities": [{"name": "Museum"}],
+    }
+    assert calls == {
+        "hotels": ("Tokyo", "2026-01-15", "2026-01-16"),
+        "activities": ("Tokyo", "things to do"),
+    }
+
+
+def scan_best_return_flight(outbound, return_flights):
+    """The original matcher: score every return flight, first best score wins."""
+    if not return_flights:
+        return None
+    outbound_airline = outbound.get("airline", "").lower()
+    outbound_stops = outbound.get("stops", 0)
+    scored_flights = []
+    for rf in return_flights:
+        score = 0
+        if rf.get("airline", "").lower() == outbound_airline:
+            score += 10
+        score -= abs(rf.get("stops", 0) - outbound_stops) * 2
+        if outbound_stops == 0 and rf.get("stops", 0) == 0:
+            score += 5
+        scored_flights.append((score, rf))
+    scored_flights.sort(key=lambda x: x[0], reverse=True)
+    return scored_flights[0][1]
+
+
+def best_return_flight(outbound, return_flights):
+    index = serpapi_tools._index_return_flights(return_flights)
+    return serpapi_tools._find_best_return_flight(outbound, index)
+
+
+def test_return_flight_prefers_same_airline():
+    return_flights = [
+        {"airline": "Delta", "stops": 0, "price": 300},
+        {"airline": "ANA", "stops": 1, "price": 500},
+    ]
+
+    # Same airline outweighs the non-stop bonus and one extra stop
+    assert best_return_flight({"airline": "ana", "stops": 0}, return_flights) is return_flights[1]
+    # Without a same-airline option the closest stop count wins
+    assert best_return_flight({"airline": "JAL", "stops": 0}, return_flights) is return_flights[0]
+
+
+def test_return_flight_ties_keep_first_listed():
+    return_flights = [
+        {"airline": "United", "stops": 1, "price": 400},
+        {"airline": "United", "stops": 1, "price": 400},
+        {"airline": "Delta", "stops": 1, "price": 400},
+    ]
+
+    assert best_return_flight({"airline": "United", "stops": 1}, return_flights) is return_flights[0]
+    assert best_return_flight({"airline": "Delta", "stops": 1}, return_flights) is return_flights[2]
+    assert best_return_flight({"airline": "JAL", "stops": 1}, return_flights) is return_flights[0]
+
+
+def test_return_flight_empty_pool():
+    assert best_return_flight({"airline": "United", "stops": 0}, []) is None
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_return_flight_index_matches_scan(seed):
+    rnd = random.Random(seed)
+    airlines = ["United", "united", "Delta", "ANA", ""]
+    for _ in range(200):
+        return_flights = [
+            {"airline": rnd.choice(airlines), "stops": rnd.randrange(0, 4),
+             "price": rnd.choice([200, 300, 400])}
+            for _ in range(rnd.randrange(0, 8))
+        ]
+        for rf in return_flights:
+            if rnd.random() < 0.1:
+                del rf["stops"]
+        outbound = {"airline": rnd.choice(airlines), "stops": rnd.randrange(0, 4)}
+
+        assert best_return_flight(outbound, return_flights) is scan_best_return_flight(
+            outbound, return_flights
+        )
@@ -0,0 +1,145 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+find_cheapest_plan is checked against a direct flight x hotel scan: the
+original algorithm, built from the public per-hotel filters. The indexed
+search must pick the same flight and hotel objects, including on price ties.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.travel.travel_logic import (
+    extract_arrival_datetime,
+    filter_hotels_by_rating,
+    filter_valid_hotels,
+    find_cheapest_plan,
+    MIN_LOCATION_RATING,
+    MIN_OVERALL_RATING,
+)
+from config.config import TRAVEL_HOTEL_CHECKIN_GAP_HOURS
+
+
+def reference_plan(flights, hotels, gap_hours=None):
+    """Scan every flight x hotel pair, keeping the first strictly cheaper one."""
+    if gap_hours is None:
+        gap_hours = TRAVEL_HOTEL_CHECKIN_GAP_HOURS
+    if not flights or not hotels:
+        return None
+
+    quality_hotels = (
+        filter_hotels_by_rating(hotels, MIN_OVERALL_RATING, MIN_LOCATION_RATING)
+        or filter_hotels_by_rating(hotels, MIN_OVERALL_RATING, 0)
+        or [h for h in hotels if (h.get("overall_rating") or h.get("rating") or 0) >= 3.0]
+        or hotels
+    )
+
+    best_plan = None
+    best_total_price = float("inf")
+    for flight in flights:
+        arrival = extract_arrival_datetime(flight)
+        if arrival is None:
+            continue
+        for hotel in filter_valid_hotels(quality_hotels, arrival, gap_hours):
+            total_price = (flight.get("price") or 0) + (hotel.get("price") or 0)
+            if total_price < best_total_price:
+                best_total_price = total_price
+                best_plan = {
+                    "flight": flight,
+                    "hotel": hotel,
+                    "total_price": total_price,
+                    "gap_hours": gap_hours,
+                    "arrival_time": arrival.strftime("%Y-%m-%d %H:%M"),
+                }
+    return best_plan
+
+
+def plan_key(plan):
+    """Identity of the chosen records plus the derived fields."""
+    if plan is None:
+        return None
+    return (
+        id(plan["flight"]),
+        id(plan["hotel"]),
+        plan["total_price"],
+        plan["gap_hours"],
+        plan["arrival_time"],
+    )
+
+
+def random_flight(rnd):
+    arrival = datetime(2026, 1, 14) + timedelta(minutes=rnd.randrange(0, 3 * 1440))
+    fmt = rnd.choice(["%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", None])
+    return {
+        "airline": "Test Air",
+        # A small price pool makes equal totals common
+        "price": rnd.choice([None, 0, 100, 150, 200, 250]),
+        "arrival_time": arrival.strftime(fmt) if fmt else rnd.choice(["", "garbage"]),
+    }
+
+
+def random_hotel(rnd, i):
+    hotel = {
+        "name": f"Hotel {i}",
+        "price": rnd.choice([None, 0, 50, 100, 150, 100.5]),
+        "overall_rating": rnd.choice([0, 2.9, 3.0, 3.5, 3.7, 4.2, 4.8]),
+        "rating": rnd.choice([0, 3.1, 4.0]),
+        "location_rating": rnd.choice([0, 3.5, 4.0, 4.6]),
+    }
+    if rnd.random() < 0.9:
+        day = datetime(2026, 1, 14) + timedelta(days=rnd.randrange(0, 4))
+        hotel["check_in_date"] = day.strftime("%Y-%m-%d")
+    if rnd.random() < 0.7:
+        hotel["check_in_time"] = rnd.choice(
+            ["15:00", "14:00", "22:30", "3:00 PM", "11:00 AM", "23:59", "00:00", "bad"]
+        )
+    return hotel
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_on_random_inputs(seed):
+    rnd = random.Random(seed)
+    for _ in range(100):
+        flights = [random_flight(rnd) for _ in range(rnd.randrange(0, 8))]
+        hotels = [random_hotel(rnd, i) for i in range(rnd.randrange(0, 10))]
+        gap_hours = rnd.choice([None, 0, 1, 2, 5, 12, 30])
+
+        assert plan_key(find_cheapest_plan(flights, hotels, gap_hours)) == plan_key(
+            reference_plan(flights, hotels, gap_hours)
+        )
+
+
+def test_price_ties_keep_first_flight_and_hotel():
+    # Every pair totals 300; the first flight and first hotel in input order win
+    flights = [
+        {"airline": "A", "price": 100, "arrival_time": "2026-01-15 09:00"},
+        {"airline": "B", "price": 100, "arrival_time": "2026-01-15 08:00"},
+    ]
+    hotels = [
+        {"name": "H1", "price": 200, "overall_rating": 4.5, "location_rating": 4.5,
+         "check_in_date": "2026-01-15", "check_in_time": "15:00"},
+        {"name": "H2", "price": 200.0, "overall_rating": 4.5, "location_rating": 4.5,
+         "check_in_date": "2026-01-15", "check_in_time": "15:00"},
+        {"name": "H3", "price": 200, "overall_rating": 4.5, "location_rating": 4.5,
+         "check_in_date": "2026-01-15", "check_in_time": "14:00"},
+    ]
+
+    plan = find_cheapest_plan(flights, hotels, gap_hours=2)
+
+    assert plan_key(plan) == plan_key(reference_plan(flights, hotels, gap_hours=2))
+    assert plan["flight"] is flights[0]
+    assert plan["hotel"] is hotels[0]
+    assert plan["total_price"] == 300
+
+
+def test_returns_none_without_valid_combination():
+    flights = [{"airline": "A", "price": 100, "arrival_time": "2026-01-20 09:00"}]
+    hotels = [{"name": "H1", "price": 100, "overall_rating": 4.5,
+               "check_in_date": "2026-01-15", "check_in_time": "15:00"}]
+
+    assert find_cheapest_plan(flights, hotels) is None
+    assert find_cheapest_plan([], hotels) is None
+    assert find_cheapest_plan(flights, []) is None